@@ -1,15 +1,22 @@
 # app.py
+import time
 import pandas as pd
 import streamlit as st
 import matplotlib.pyplot as plt
 from wordcloud import WordCloud, STOPWORDS
 from streamlit_option_menu import option_menu
-import dateparser
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
 from crawling import run_crawling_and_analysis
 from supabase_utils import get_supabase_client
+from comments_frame import (
+    DETAIL_COLUMNS, build_comments_frame, count_comments, fetch_comments_page, paginate_frame, seek_comments_cursor,
+)
+from search_index import IndexBackfill, count_search_results, delete_reviews, index_reviews, search_page
+from chart_cache import ChartCache, data_version
+from archive import export_comments, read_archive
+from change_feed import LIVE_POLL_SECONDS, LIVE_UPDATES, LiveComments, create_change_feed
 
 # -------------------------
 # Supabase client
@@ -18,6 +25,10 @@ from supabase_utils import get_supabase_client
 def get_client():
     return get_supabase_client()
 
+@st.cache_resource
+def get_chart_cache():
+    return ChartCache(max_items=64)
+
 # -------------------------
 # Page config
 # -------------------------
@@ -58,8 +69,7 @@ st.markdown(
 # -------------------------
 # Helpers
 # -------------------------
-@st.cache_data(ttl=300)
-def load_comments():
+def fetch_all_comments():
     try:
         supabase = get_client()
         resp = supabase.table("comments").select("*").execute()
@@ -67,25 +77,110 @@ def load_comments():
         if not data:
             return pd.DataFrame()
 
-        df = pd.DataFrame(data)
-        if "created_at" in df.columns:
-            df["created_at"] = df["created_at"].apply(
-                lambda x: dateparser.parse(str(x)) if pd.notnull(x) else pd.NaT
-            )
-        else:
-            df["created_at"] = pd.NaT
-
-        for col in ["comment_text", "username", "sentimen_label",
-                    "sentiment_score", "rating", "source", "review_id"]:
-            if col not in df.columns:
-                df[col] = None
-
-        df = df.sort_values("created_at", ascending=False, na_position="last").reset_index(drop=True)
-        return df
+        return build_comments_frame(data)
     except Exception as e:
         st.error(f"Gagal mengambil data dari Supabase: {e}")
         return pd.DataFrame()
 
+@st.cache_data(ttl=300)
+def load_comments():
+    return fetch_all_comments()
+
+def index_live_delta(upserted, deleted):
+    index_reviews(upserted)
+    delete_reviews(deleted)
+
+@st.cache_resource
+def get_live_comments():
+    # Feed jalan dulu (event diantrikan), baru satu kali ambil penuh; setelah itu hanya delta
+    live = LiveComments()
+    live.add_listener(index_live_delta)
+    try:
+        create_change_feed(get_client()).start(live.push, on_resync=live.request_resync, on_down=live.mark_feed_down)
+    except Exception as e:
+        live.mark_feed_down(str(e))
+    live.reload(fetch_all_comments())
+    return live
+
+def live_active():
+    """True jika frame live bisa dipakai: LIVE_UPDATES=1 dan change feed sedang tersambung."""
+    return LIVE_UPDATES and get_live_comments().feed_up
+
+def get_comments():
+    """Data comments untuk tab: frame live jika feed aktif, selain itu cache TTL."""
+    if not live_active():
+        return load_comments()
+    live = get_live_comments()
+    if live.take_resync():
+        # Feed tersambung ulang: ambil snapshot baru, event yang antri diterapkan di atasnya
+        live.reload(fetch_all_comments())
+    live.apply_pending()
+    return live.frame
+
+def view_version(df, source="Semua"):
+    """Versi untuk key cache view turunan; mode live hanya berubah untuk source yang terkena delta."""
+    if live_active():
+        return get_live_comments().version(source)
+    return data_version(df)
+
+@st.cache_data(ttl=300)
+def load_comments_page(page_size, sort_by, descending, source, search, after):
+    return fetch_comments_page(get_client(), page_size, sort_by, descending, source, search, after)
+
+@st.cache_data(ttl=300)
+def load_comments_count(source, search):
+    # Total hanya bergantung pada filter, tidak dihitung ulang tiap ganti halaman/urutan
+    return count_comments(get_client(), source, search)
+
+def page_cursor(page, page_size, sort_by, descending, source, search):
+    """Cursor keyset untuk awal halaman `page`; cursor halaman yang sudah dibuka disimpan per sesi."""
+    if page == 1:
+        return None
+    cursors = st.session_state.setdefault("detail_cursors", {})
+    if page - 1 in cursors:
+        return cursors[page - 1]
+    # Lompat beberapa halaman: mulai dari cursor terdekat, baca kolom kunci saja
+    known = max((p for p in cursors if p < page - 1), default=0)
+    if known and cursors[known] is None:
+        return None  # data sudah habis sebelum halaman ini
+    cursor = seek_comments_cursor(get_client(), (page - 1 - known) * page_size, sort_by, descending,
+                                  source, search, cursors.get(known))
+    cursors[page - 1] = cursor
+    return cursor
+
+@st.cache_resource
+def get_index_backfill():
+    return IndexBackfill()
+
+def search_index_ready(df):
+    """True jika search index bisa dipakai; backfill/catch-up berjalan di thread latar."""
+    # Mode live: delta diindeks listener; catch-up ulang hanya setelah snapshot baru
+    key = f"live-{get_live_comments().generation}" if live_active() else data_version(df)
+    columns = ["review_id", "comment_text", "source", "rating", "sentiment_score", "created_at"]
+    return get_index_backfill().ensure(key, lambda: df[columns].dropna(subset=["review_id"]).to_dict("records"))
+
+@st.cache_data(ttl=300)
+def load_search_count(search, source, match_any, version):
+    # Total hasil pencarian per query + filter + versi data, tidak dihitung ulang tiap halaman
+    return count_search_results(search, source, match_any=match_any)
+
+@st.cache_resource(max_entries=2)
+def review_positions(version, _df):
+    # review_id -> posisi baris, supaya hanya baris di halaman hasil pencarian yang diambil.
+    # Index object: get_indexer di index string Arrow jauh lebih lambat
+    return pd.Index(_df["review_id"].astype(object))
+
+@st.cache_data(ttl=300)
+def load_archive_slice(source, start, end):
+    return read_archive(source=source, start=start, end=end)
+
+def update_archive():
+    try:
+        export_comments(get_client())
+    except Exception as e:
+        st.error(f"Gagal memperbarui arsip: {e}")
+    load_archive_slice.clear()
+
 def generate_wordcloud(text_series, max_words=150):
     text = " ".join(text_series.dropna().astype(str).values)
     if not text.strip():
@@ -97,6 +192,12 @@ def generate_wordcloud(text_series, max_words=150):
 
 def clear_cache():
     load_comments.clear()
+    load_comments_page.clear()
+    load_comments_count.clear()
+    if LIVE_UPDATES:
+        get_live_comments().reload(fetch_all_comments())
+
+chart_cache = get_chart_cache()
 
 # -------------------------
 # Default values (fix ke Samsat Palembang 1)
@@ -126,6 +227,19 @@ st.markdown(
     unsafe_allow_html=True
 )
 
+# Mode live: cek antrean delta tiap beberapa detik (di memori, tanpa query ke Supabase)
+if LIVE_UPDATES:
+    @st.fragment(run_every=LIVE_POLL_SECONDS)
+    def watch_live_updates():
+        # Body fragment juga jalan saat render penuh; tanpa jeda ini, review yang
+        # masuk selama render akan memicu rerun tanpa henti
+        rendered_at = st.session_state.get("_live_rendered_at", 0)
+        if get_live_comments().has_pending() and time.monotonic() - rendered_at >= LIVE_POLL_SECONDS:
+            st.rerun()
+
+    st.session_state["_live_rendered_at"] = time.monotonic()
+    watch_live_updates()
+
 # load material icons
 st.markdown("""
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
@@ -140,7 +254,7 @@ if selected == "Home":
     st.markdown("<p style='color:#6b7280;margin-top:6px'>Dashboard ringkasan sentimen komentar publik dari Google Maps & Play Store.</p>", unsafe_allow_html=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
-    df = load_comments()
+    df = get_comments()
     total = len(df)
     pos = int((df["sentimen_label"] == "positif").sum()) if not df.empty else 0
     neg = int((df["sentimen_label"] == "negatif").sum()) if not df.empty else 0
@@ -259,69 +373,72 @@ if selected == "Home":
         st.markdown("---")
         # --- Gauge ---
         st.subheader("Indeks Keberhasilan Perbaikan")
-        fig_gauge = go.Figure(go.Indicator(
-            mode="gauge",
-            value=score_all_100,
-            title={'text': "Sentimen Terbaru"},
-            gauge={
-                'axis': {'range': [0, 100]},
-                'bar': {'color': "rgba(0,0,0,0)"},  # bar transparan
-                'steps': [
-                    {'range': [0, 40], 'color': "red"},
-                    {'range': [40, 70], 'color': "orange"},
-                    {'range': [70, 100], 'color': "green"},
-                ],
-            }
-        ))
-
-        # Hitung posisi jarum
-        angle = (score_all_100 / 100) * 180
-        radians = np.deg2rad(angle)
-        needle_length = 0.17
-        center_x, center_y = 0.5, 0.38
-
-        x = center_x + needle_length * np.cos(np.pi - radians)
-        y = center_y + needle_length * np.sin(np.pi - radians)
-
-        # Jarum
-        fig_gauge.add_shape(type="line",
-            x0=center_x, y0=center_y, x1=x, y1=y,
-            line=dict(color="black", width=3)
-        )
+        def build_gauge():
+            fig_gauge = go.Figure(go.Indicator(
+                mode="gauge",
+                value=score_all_100,
+                title={'text': "Sentimen Terbaru"},
+                gauge={
+                    'axis': {'range': [0, 100]},
+                    'bar': {'color': "rgba(0,0,0,0)"},  # bar transparan
+                    'steps': [
+                        {'range': [0, 40], 'color': "red"},
+                        {'range': [40, 70], 'color': "orange"},
+                        {'range': [70, 100], 'color': "green"},
+                    ],
+                }
+            ))
+
+            # Hitung posisi jarum
+            angle = (score_all_100 / 100) * 180
+            radians = np.deg2rad(angle)
+            needle_length = 0.17
+            center_x, center_y = 0.5, 0.38
+
+            x = center_x + needle_length * np.cos(np.pi - radians)
+            y = center_y + needle_length * np.sin(np.pi - radians)
+
+            # Jarum
+            fig_gauge.add_shape(type="line",
+                x0=center_x, y0=center_y, x1=x, y1=y,
+                line=dict(color="black", width=3)
+            )
 
-        # Bulatan tengah
-        fig_gauge.add_shape(type="circle",
-            x0=center_x-0.015, y0=center_y-0.015,
-            x1=center_x+0.015, y1=center_y+0.015,
-            fillcolor="black", line_color="black"
-        )
+            # Bulatan tengah
+            fig_gauge.add_shape(type="circle",
+                x0=center_x-0.015, y0=center_y-0.015,
+                x1=center_x+0.015, y1=center_y+0.015,
+                fillcolor="black", line_color="black"
+            )
 
-        # --- Scatter transparan supaya hover aktif ---
-        theta = np.linspace(0, np.pi, 200)
-        xs = 0.5 + 0.35 * np.cos(theta)
-        ys = 0.38 + 0.35 * np.sin(theta)
-
-        fig_gauge.add_trace(go.Scatter(
-            x=xs, y=ys,
-            mode="lines",
-            line=dict(width=0),
-            fill="toself",
-            fillcolor="rgba(0,0,0,0)",
-            hoverinfo="text",
-            text=[f"<b>{score_all_100}%</b>"]*len(xs),
-            showlegend=False,
-            name=""   
-        ))
-
-        fig_gauge.update_layout(
-            height=400,
-            margin=dict(l=40, r=40, t=40, b=40),
-            paper_bgcolor="white",
-            plot_bgcolor="white",
-            xaxis=dict(visible=False),
-            yaxis=dict(visible=False)
-        )
+            # --- Scatter transparan supaya hover aktif ---
+            theta = np.linspace(0, np.pi, 200)
+            xs = 0.5 + 0.35 * np.cos(theta)
+            ys = 0.38 + 0.35 * np.sin(theta)
+
+            fig_gauge.add_trace(go.Scatter(
+                x=xs, y=ys,
+                mode="lines",
+                line=dict(width=0),
+                fill="toself",
+                fillcolor="rgba(0,0,0,0)",
+                hoverinfo="text",
+                text=[f"<b>{score_all_100}%</b>"]*len(xs),
+                showlegend=False,
+                name=""   
+            ))
+
+            fig_gauge.update_layout(
+                height=400,
+                margin=dict(l=40, r=40, t=40, b=40),
+                paper_bgcolor="white",
+                plot_bgcolor="white",
+                xaxis=dict(visible=False),
+                yaxis=dict(visible=False)
+            )
+            return fig_gauge
 
+        fig_gauge = chart_cache.plotly_figure(("gauge", "Semua", view_version(df)), build_gauge)
         st.plotly_chart(fig_gauge, use_container_width=True)
 
         # --- Keterangan detail di bawah gauge (tengah) ---
@@ -378,7 +495,8 @@ elif selected == "Crawl Data":
                     app_package_name=app_pkg.strip() if source in ["Google Play Store", "Keduanya"] else None,
                     status_placeholder=status_placeholder,
                 )
-                clear_cache()
+                if not live_active():
+                    clear_cache()  # mode live: review baru datang lewat change feed
                 st.success("Crawling selesai! Silakan buka tab lain untuk melihat hasil.")
             except Exception as e:
                 st.error(f"Gagal menjalankan crawling: {e}")
@@ -391,7 +509,7 @@ elif selected == "Analisis":
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.header("Analisis Komentar")
 
-    df = load_comments()
+    df = get_comments()
     if df.empty:
         st.info("Belum ada data. Silakan lakukan Crawling Data.")
     else:
@@ -530,11 +648,109 @@ elif selected == "Analisis":
 
         st.markdown("---")
         st.subheader("Komentar Detail")
+        sort_options = {"Tanggal": "created_at", "Rating": "rating", "Skor Sentimen": "sentiment_score", "Sumber": "source"}
+        t1, t2, t3, t4, t5 = st.columns([3, 2, 1, 1, 1])
+        with t1:
+            search = st.text_input("Cari komentar", placeholder="mis. stnk, antri, pajak").strip()
+            match_any = st.checkbox("Cocokkan salah satu kata", value=False)
+        with t2:
+            sort_label = st.selectbox("Urutkan", list(sort_options), index=0)
+        with t3:
+            descending = st.selectbox("Arah", ["Turun", "Naik"], index=0) == "Turun"
+        with t4:
+            page_size = st.selectbox("Baris", [25, 50, 100], index=1)
+
+        # Halaman kembali ke 1 setiap kali pencarian, filter atau urutan berubah
+        detail_filters = (search, match_any, sumber_filter, sort_label, descending, page_size)
+        if st.session_state.get("detail_filters") != detail_filters:
+            st.session_state["detail_filters"] = detail_filters
+            st.session_state["detail_page"] = 1
+            st.session_state["detail_cursors"] = {}
+        page = int(st.session_state.get("detail_page", 1))
+
+        index_ready = bool(search) and search_index_ready(df)
+        if search and not index_ready:
+            st.caption("Search index sedang dibangun, sementara memakai pencarian teks biasa.")
+
+        # Hanya halaman aktif yang diambil & dikirim ke browser
+        def fetch_detail_page(page):
+            page_args = dict(
+                page=page,
+                page_size=page_size,
+                sort_by=sort_options[sort_label],
+                descending=descending,
+                source=None if sumber_filter == "Semua" else sumber_filter,
+                search=search or None,
+            )
+            if search and index_ready:
+                # Pencarian lewat inverted index: COUNT sekali per filter, halaman diambil di SQLite
+                index_version = (view_version(df), get_index_backfill().synced_key)
+                total_rows = load_search_count(search, page_args["source"], match_any, index_version)
+                page_ids, total_rows = search_page(
+                    search, page, page_size, page_args["sort_by"], descending,
+                    page_args["source"], match_any=match_any, total=total_rows,
+                )
+                positions = review_positions(view_version(df), df).get_indexer(page_ids)
+                page_df = df.iloc[positions[positions >= 0]][DETAIL_COLUMNS]
+            elif live_active():
+                # Frame live sudah di memori dan selalu terbaru
+                page_df, total_rows = paginate_frame(df, **page_args)
+            else:
+                try:
+                    key_args = {k: page_args[k] for k in ("sort_by", "descending", "source", "search")}
+                    after = page_cursor(page, page_size, **key_args)
+                    if page > 1 and after is None:
+                        page_df = pd.DataFrame(columns=DETAIL_COLUMNS)  # melewati data terakhir
+                    else:
+                        page_df, cursor = load_comments_page(page_size, after=after, **key_args)
+                        st.session_state.setdefault("detail_cursors", {})[page] = cursor
+                    total_rows = load_comments_count(page_args["source"], page_args["search"])
+                except Exception as e:
+                    print(f"[WARNING] Pagination di Supabase gagal, pakai data cache: {e}")
+                    page_df, total_rows = paginate_frame(df, **page_args)
+            return page_df, total_rows
+
+        page_df, total_rows = fetch_detail_page(page)
+        total_pages = max(1, -(-total_rows // page_size))
+        if page > total_pages:
+            # Data berkurang (mis. review dihapus): pindah ke halaman terakhir
+            page = total_pages
+            st.session_state["detail_page"] = page
+            page_df, total_rows = fetch_detail_page(page)
+        with t5:
+            st.number_input("Halaman", min_value=1, max_value=total_pages, step=1, key="detail_page")
+        st.caption(f"Halaman {int(page)} dari {total_pages} — {total_rows} komentar")
         st.dataframe(
-            df_filtered[["source", "username", "comment_text", "rating", "sentimen_label", "sentiment_score", "created_at"]],
+            page_df,
             height=400,
             use_container_width=True,
         )
+
+        st.markdown("---")
+        with st.expander("Arsip Historis (Parquet)"):
+            today = pd.Timestamp.now().date()
+            a1, a2 = st.columns([3, 1])
+            with a1:
+                arsip_range = st.date_input("Rentang tanggal", value=(today - pd.Timedelta(days=30), today))
+            with a2:
+                st.button("📦 Perbarui arsip", on_click=update_archive, use_container_width=True)
+
+            if isinstance(arsip_range, tuple) and len(arsip_range) == 2:
+                # Hanya partisi source/bulan yang masuk rentang yang dibaca dari disk
+                arsip_df = load_archive_slice(
+                    None if sumber_filter == "Semua" else sumber_filter,
+                    arsip_range[0],
+                    arsip_range[1],
+                )
+                if arsip_df.empty:
+                    st.info("Tidak ada data arsip untuk rentang ini.")
+                else:
+                    label_counts = arsip_df["sentimen_label"].value_counts()
+                    st.caption(
+                        f"{len(arsip_df)} komentar arsip — "
+                        + ", ".join(f"{label}: {count}" for label, count in label_counts.items())
+                    )
+                    st.dataframe(arsip_df[DETAIL_COLUMNS].head(500), height=300, use_container_width=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
 # -------------------------
@@ -544,7 +760,7 @@ elif selected == "Visualisasi":
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.header("Visualisasi Sentimen")
 
-    df = load_comments()
+    df = get_comments()
     if df.empty:
         st.info("Tidak ada data untuk divisualisasikan.")
     else:
@@ -555,7 +771,8 @@ elif selected == "Visualisasi":
         )
         df_filtered = df if sumber_filter == "Semua" else df[df["source"] == sumber_filter]
 
-        df_filtered["sentimen_label"] = df_filtered["sentimen_label"].astype(str).str.strip().str.lower()
+        # assign, bukan ubah di tempat: frame bisa dipakai bersama antar sesi (mode live)
+        df_filtered = df_filtered.assign(sentimen_label=df_filtered["sentimen_label"].astype(str).str.strip().str.lower())
         sentimen_counts = df_filtered["sentimen_label"].value_counts().reset_index()
         sentimen_counts.columns = ["Sentimen", "Jumlah"]
         sentimen_counts["Sentimen"] = sentimen_counts["Sentimen"].str.capitalize()
@@ -563,29 +780,40 @@ elif selected == "Visualisasi":
         # -------------------------
         # Baris 1 (Bar & Pie)
         # -------------------------
+        # Chart di-cache per (jenis, sumber, versi data); figure langsung ditutup
+        version = view_version(df, sumber_filter)
+
         col1, col2 = st.columns(2)
         with col1:
             st.subheader("Jumlah Komentar per Sentimen")
-            fig_bar = px.bar(
-                sentimen_counts,
-                x="Sentimen",
-                y="Jumlah",
-                color="Sentimen",
-                color_discrete_map={"Positif": "green", "Netral": "gray", "Negatif": "red"},
-                text="Jumlah",
-            )
-            fig_bar.update_traces(textposition="outside")
-            fig_bar.update_layout(yaxis=dict(dtick=1))
+
+            def build_bar():
+                fig_bar = px.bar(
+                    sentimen_counts,
+                    x="Sentimen",
+                    y="Jumlah",
+                    color="Sentimen",
+                    color_discrete_map={"Positif": "green", "Netral": "gray", "Negatif": "red"},
+                    text="Jumlah",
+                )
+                fig_bar.update_traces(textposition="outside")
+                fig_bar.update_layout(yaxis=dict(dtick=1))
+                return fig_bar
+
+            fig_bar = chart_cache.plotly_figure(("bar", sumber_filter, version), build_bar)
             st.plotly_chart(fig_bar, use_container_width=True)
 
         with col2:
             st.subheader("Persentase Sentimen")
             overall = df_filtered["sentimen_label"].value_counts()
             if not overall.empty:
-                fig1, ax1 = plt.subplots(figsize=(4, 4))
-                ax1.pie(overall.values, labels=overall.index, autopct="%1.1f%%", startangle=90)
-                ax1.axis("equal")
-                st.pyplot(fig1, use_container_width=True)
+                def build_pie():
+                    fig1, ax1 = plt.subplots(figsize=(4, 4))
+                    ax1.pie(overall.values, labels=overall.index, autopct="%1.1f%%", startangle=90)
+                    ax1.axis("equal")
+                    return fig1
+
+                st.image(chart_cache.matplotlib_png(("pie", sumber_filter, version), build_pie), use_container_width=True)
             else:
                 st.info("Tidak ada data untuk pie chart.")
 
@@ -597,40 +825,56 @@ elif selected == "Visualisasi":
             st.subheader("Tren Sentimen Mingguan")
             df_trend = df_filtered.dropna(subset=["created_at"]).copy()
             if not df_trend.empty:
-                df_trend["week"] = df_trend["created_at"].dt.to_period("W").dt.to_timestamp()
-                trend = df_trend.groupby(["week", "sentimen_label"]).size().reset_index(name="count")
-                trend_pivot = trend.pivot(index="week", columns="sentimen_label", values="count").fillna(0)
-
-                # Pastikan semua kolom selalu ada
-                trend_pivot = trend_pivot.reindex(columns=["positif", "netral", "negatif"], fill_value=0)
-
-                fig_area, ax_area = plt.subplots(figsize=(12, 5))
-                trend_pivot.plot.area(
-                    stacked=True,
-                    ax=ax_area,
-                    alpha=0.8,
-                    color=["green", "gray", "red"]
-                )
-
-                ax_area.set_title("Sentiment Trend (Mingguan)")
-                ax_area.set_xlabel("Minggu")
-                ax_area.set_ylabel("Jumlah Komentar")
-                ax_area.grid(alpha=0.3)
-                st.pyplot(fig_area, use_container_width=True)
+                def build_trend():
+                    df_trend["week"] = df_trend["created_at"].dt.to_period("W").dt.to_timestamp()
+                    trend = df_trend.groupby(["week", "sentimen_label"]).size().reset_index(name="count")
+                    trend_pivot = trend.pivot(index="week", columns="sentimen_label", values="count").fillna(0)
+
+                    # Pastikan semua kolom selalu ada
+                    trend_pivot = trend_pivot.reindex(columns=["positif", "netral", "negatif"], fill_value=0)
+
+                    fig_area, ax_area = plt.subplots(figsize=(12, 5))
+                    trend_pivot.plot.area(
+                        stacked=True,
+                        ax=ax_area,
+                        alpha=0.8,
+                        color=["green", "gray", "red"]
+                    )
+
+                    ax_area.set_title("Sentiment Trend (Mingguan)")
+                    ax_area.set_xlabel("Minggu")
+                    ax_area.set_ylabel("Jumlah Komentar")
+                    ax_area.grid(alpha=0.3)
+                    return fig_area
+
+                st.image(chart_cache.matplotlib_png(("trend", sumber_filter, version), build_trend), use_container_width=True)
             else:
                 st.info("Tidak ada data untuk tren mingguan.")
 
         with col4:
             st.subheader("WordCloud (Komentar)")
-            wc = generate_wordcloud(df_filtered["comment_text"])
-            if wc:
+
+            def build_wordcloud():
+                wc = generate_wordcloud(df_filtered["comment_text"])
+                if not wc:
+                    return None
                 fig2, ax2 = plt.subplots(figsize=(6, 4))
                 ax2.imshow(wc, interpolation="bilinear")
                 ax2.axis("off")
-                st.pyplot(fig2, use_container_width=True)
+                return fig2
+
+            wc_png = chart_cache.matplotlib_png(("wordcloud", sumber_filter, version), build_wordcloud)
+            if wc_png:
+                st.image(wc_png, use_container_width=True)
             else:
                 st.info("Tidak ada teks untuk WordCloud.")
 
+        cache_stats = chart_cache.stats()
+        st.caption(
+            f"Cache chart: {cache_stats['items']} chart, {cache_stats['hits']} hit / {cache_stats['misses']} miss, "
+            f"hemat render {cache_stats['render_saved_s']:.1f} detik, memori {cache_stats['resident_bytes'] / 1024:.0f} KB"
+        )
+
 # -------------------------
 # Tentang
 # -------------------------
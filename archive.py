@@ -0,0 +1,148 @@
+# archive.py
+"""Arsip review yang sudah diberi skor ke Parquet, dipartisi per source & bulan.
+
+Ekspor bersifat incremental: hanya baris dengan processed_at setelah
+watermark run sebelumnya yang ditulis. Baca arsip lewat read_archive,
+yang memakai predicate pushdown (partisi + kolom created_at).
+
+Jalankan:
+    python archive.py export
+"""
+import argparse
+import json
+import os
+import uuid
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from comments_frame import build_comments_frame, enforce_comment_schema
+
+ARCHIVE_DIR = os.environ.get("COMMENTS_ARCHIVE_DIR", os.path.join("archive", "comments"))
+WATERMARK_FILE = "_watermark.json"
+EXPORT_PAGE_SIZE = 1000
+EPOCH = "1970-01-01T00:00:00"
+
+PARTITIONING = ds.partitioning(
+    pa.schema([("source", pa.string()), ("month", pa.string())]),
+    flavor="hive",
+)
+
+
+def read_watermark(root=None):
+    path = os.path.join(root or ARCHIVE_DIR, WATERMARK_FILE)
+    if not os.path.exists(path):
+        return EPOCH
+    with open(path) as f:
+        return json.load(f).get("processed_at") or EPOCH
+
+
+def write_watermark(value, root=None):
+    root = root or ARCHIVE_DIR
+    os.makedirs(root, exist_ok=True)
+    with open(os.path.join(root, WATERMARK_FILE), "w") as f:
+        json.dump({"processed_at": value}, f)
+
+
+def fetch_scored_since(client, since, page_size=EXPORT_PAGE_SIZE):
+    """Ambil semua review dengan processed_at > since, per halaman."""
+    offset = 0
+    while True:
+        resp = (
+            client.table("comments").select("*")
+            .gt("processed_at", since)
+            .order("processed_at").order("review_id")
+            .range(offset, offset + page_size - 1)
+            .execute()
+        )
+        rows = resp.data or []
+        yield from rows
+        if len(rows) < page_size:
+            break
+        offset += page_size
+
+
+def to_archive_table(records):
+    df = build_comments_frame(records)
+    df["source"] = df["source"].astype("string").fillna("unknown")
+    month = df["created_at"].fillna(df["processed_at"]).dt.strftime("%Y-%m")
+    df["month"] = month.fillna("unknown")
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def export_comments(client, root=None):
+    """Tulis review yang baru diproses sejak ekspor terakhir. Return jumlah baris."""
+    root = root or ARCHIVE_DIR
+    since = read_watermark(root)
+    records = list(fetch_scored_since(client, since))
+    if not records:
+        print(f"[INFO] Tidak ada review baru untuk diarsipkan (watermark {since}).")
+        return 0
+
+    ds.write_dataset(
+        to_archive_table(records),
+        root,
+        format="parquet",
+        partitioning=PARTITIONING,
+        basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+    write_watermark(max(r["processed_at"] for r in records), root)
+    print(f"[INFO] {len(records)} review diarsipkan ke {root}.")
+    return len(records)
+
+
+def read_archive(root=None, source=None, start=None, end=None, columns=None):
+    """Baca potongan arsip; hanya partisi & row group yang lolos filter yang dibaca."""
+    root = root or ARCHIVE_DIR
+    if not os.path.isdir(root):
+        return pd.DataFrame()
+
+    dataset = ds.dataset(root, format="parquet", partitioning=PARTITIONING,
+                         exclude_invalid_files=True, ignore_prefixes=["_", "."])
+    conditions = []
+    if source:
+        conditions.append(ds.field("source") == source)
+    if start is not None:
+        start = pd.Timestamp(start)
+        conditions.append(ds.field("month") >= start.strftime("%Y-%m"))
+        conditions.append(ds.field("created_at") >= start.to_pydatetime())
+    if end is not None:
+        end = pd.Timestamp(end)
+        # Tanggal tanpa jam dianggap inklusif sampai akhir hari itu
+        end_exclusive = end + pd.Timedelta(days=1) if end == end.normalize() else end
+        conditions.append(ds.field("month") <= end.strftime("%Y-%m"))
+        conditions.append(ds.field("created_at") < end_exclusive.to_pydatetime())
+
+    row_filter = None
+    for condition in conditions:
+        row_filter = condition if row_filter is None else row_filter & condition
+
+    if columns is not None:
+        columns = list(dict.fromkeys([*columns, "review_id", "processed_at"]))
+    df = dataset.to_table(filter=row_filter, columns=columns).to_pandas()
+    if df.empty:
+        return df
+
+    # Review yang diproses ulang bisa muncul di beberapa file: ambil yang terbaru
+    df = df.sort_values("processed_at").drop_duplicates("review_id", keep="last")
+    df = enforce_comment_schema(df.drop(columns=[c for c in ["month"] if c in df.columns]))
+    df = df.sort_values("created_at", ascending=False, na_position="last").reset_index(drop=True)
+    if columns is not None:
+        df = df[[c for c in columns if c in df.columns]]
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("command", choices=["export"])
+    parser.add_argument("--root", default=ARCHIVE_DIR)
+    args = parser.parse_args()
+
+    from supabase_utils import get_supabase_client
+    export_comments(get_supabase_client(), root=args.root)
+
+
+if __name__ == "__main__":
+    main()
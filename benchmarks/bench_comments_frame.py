@@ -0,0 +1,101 @@
+# benchmarks/bench_comments_frame.py
+"""Bandingkan memori dan kecepatan frame comments lama (object) vs frame bertipe.
+
+Jalankan dari root repo:
+    python benchmarks/bench_comments_frame.py --rows 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comments_frame import build_comments_frame  # noqa: E402
+
+WORDS = ["pelayanan", "cepat", "lambat", "antri", "stnk", "pajak", "bayar", "aplikasi",
+         "error", "petugas", "ramah", "bagus", "buruk", "samsat", "online", "gagal"]
+
+
+def make_records(n, seed=42):
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    records = []
+    for i in range(n):
+        rating = rng.choice([1, 2, 3, 4, 5, None])
+        records.append({
+            "review_id": f"rev-{i:08d}",
+            "source": rng.choice(["gmaps", "playstore"]),
+            "username": f"user{rng.randrange(n // 3 + 1)}",
+            "comment_text": " ".join(rng.choices(WORDS, k=rng.randint(3, 25))),
+            "rating": rating,
+            "sentimen_label": rng.choice(["positif", "netral", "negatif", None]),
+            "sentiment_score": None if rating is None else str(round(rng.random(), 4)),
+            "created_at": (base + timedelta(minutes=rng.randrange(600_000))).isoformat(),
+            "processed_at": None,
+        })
+    return records
+
+
+def build_legacy_frame(records):
+    # Sama dengan load_comments lama, tapi created_at diparse sekali pakai
+    # fromisoformat (dateparser per baris terlalu lama untuk 1 juta baris);
+    # hasilnya tetap kolom object berisi datetime seperti sebelumnya.
+    df = pd.DataFrame(records)
+    df["created_at"] = df["created_at"].apply(
+        lambda x: datetime.fromisoformat(str(x)) if pd.notnull(x) else pd.NaT
+    )
+    return df.sort_values("created_at", ascending=False, na_position="last").reset_index(drop=True)
+
+
+def timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(df):
+    return {
+        "memory_mb": df.memory_usage(deep=True).sum() / 1024 ** 2,
+        "groupby_s": timed(lambda: df.groupby(["source", "sentimen_label"], observed=True).size()),
+        "filter_s": timed(lambda: df[(df["source"] == "gmaps") & (df["sentimen_label"] == "negatif")]),
+        "value_counts_s": timed(lambda: df["sentimen_label"].value_counts()),
+        "score_mean_s": timed(lambda: pd.to_numeric(df["sentiment_score"]).mean()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"[INFO] Membuat {args.rows} record sintetis...")
+    records = make_records(args.rows)
+
+    start = time.perf_counter()
+    legacy = build_legacy_frame(records)
+    legacy_build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    typed = build_comments_frame(records)
+    typed_build = time.perf_counter() - start
+
+    results = {"legacy": measure(legacy), "typed": measure(typed)}
+    results["legacy"]["build_s"] = legacy_build
+    results["typed"]["build_s"] = typed_build
+
+    print(f"{'metrik':<16}{'legacy':>12}{'typed':>12}{'rasio':>10}")
+    for metric in results["legacy"]:
+        old, new = results["legacy"][metric], results["typed"][metric]
+        ratio = old / new if new else float("nan")
+        print(f"{metric:<16}{old:>12.4f}{new:>12.4f}{ratio:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
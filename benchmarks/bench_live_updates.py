@@ -0,0 +1,65 @@
+# benchmarks/bench_live_updates.py
+"""Bandingkan refresh penuh (ambil ulang seluruh tabel) vs delta dari change feed.
+
+Review baru ditulis ke FakeSupabase; LocalChangeFeed meneruskannya ke
+LiveComments seperti Supabase Realtime meneruskan postgres_changes.
+
+Jalankan dari root repo:
+    python benchmarks/bench_live_updates.py --rows 100000 --new 20
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from change_feed import LiveComments, LocalChangeFeed  # noqa: E402
+from comments_frame import build_comments_frame  # noqa: E402
+from bench_comments_frame import make_records  # noqa: E402
+from fake_supabase import FakeSupabase  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--new", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    records = make_records(args.rows + args.new * args.rounds)
+    seed, incoming = records[:args.rows], records[args.rows:]
+    client = FakeSupabase({"comments": seed})
+
+    start = time.perf_counter()
+    live = LiveComments(build_comments_frame(client.table("comments").select("*").execute().data))
+    print(f"snapshot awal      {time.perf_counter() - start:8.3f} s ({len(live.frame)} baris)")
+    LocalChangeFeed(client).start(live.push)
+
+    full_s, delta_s = [], []
+    for i in range(args.rounds):
+        batch = incoming[i * args.new:(i + 1) * args.new]
+        for row in batch:
+            row["source"] = "gmaps"
+        versions = {s: live.version(s) for s in ["Semua", "gmaps", "playstore"]}
+        client.table("comments").upsert(batch).execute()
+
+        start = time.perf_counter()
+        live.apply_pending()
+        delta_s.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        full = build_comments_frame(client.table("comments").select("*").execute().data)
+        full_s.append(time.perf_counter() - start)
+
+        assert len(full) == len(live.frame)
+        assert set(full["review_id"]) == set(live.frame["review_id"])
+        assert live.version("playstore") == versions["playstore"], "view playstore tidak perlu di-invalidate"
+        assert live.version("gmaps") != versions["gmaps"]
+
+    print(f"refresh penuh      {sum(full_s) / len(full_s) * 1000:8.1f} ms/putaran")
+    print(f"delta change feed  {sum(delta_s) / len(delta_s) * 1000:8.1f} ms/putaran "
+          f"({args.new} review baru, dtype: {dict(live.frame.dtypes.astype(str))['source']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# benchmarks/bench_long_reviews.py
+"""Bandingkan potong-karakter lama, truncation token, dan inference berjendela untuk review panjang.
+
+Review panjang dibuat dengan menggabungkan review korpus yang labelnya sama,
+jadi label teks penuhnya diketahui; "agreement" = kecocokan dengan label itu.
+
+Jalankan dari root repo:
+    python benchmarks/bench_long_reviews.py --rows 200
+    python benchmarks/bench_long_reviews.py --model local
+"""
+import argparse
+import contextlib
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import sentiment  # noqa: E402
+from preprocessing import preprocess_text  # noqa: E402
+from corpus import REVIEWS  # noqa: E402
+from bench_sentiment import StubSentimentPipeline  # noqa: E402
+
+
+def make_long_reviews(n, min_words=300, max_words=1200, seed=7):
+    rng = random.Random(seed)
+    by_label = {}
+    for text, _, label in REVIEWS:
+        if text:
+            by_label.setdefault(label, []).append(text)
+
+    reviews = []
+    for _ in range(n):
+        label = rng.choice(sorted(by_label))
+        target = rng.randint(min_words, max_words)
+        parts = []
+        while sum(len(p.split()) for p in parts) < target:
+            parts.append(rng.choice(by_label[label]))
+        reviews.append((" ".join(parts), label))
+    return reviews
+
+
+def run(name, fn, clean_texts, expected):
+    start = time.perf_counter()
+    labels = fn(clean_texts)
+    elapsed = time.perf_counter() - start
+    agreement = sum(sentiment.map_sentiment_label(l) == e for l, e in zip(labels, expected)) / len(expected)
+    print(f"{name:<22} {len(clean_texts) / elapsed:8.1f} review/s  agreement={agreement:.3f}")
+    return labels
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--model", choices=["stub", "local"], default="stub")
+    parser.add_argument("--batch-size", type=int, default=16)
+    args = parser.parse_args()
+
+    if args.model == "stub":
+        sentiment.sentiment_pipeline = StubSentimentPipeline(delay_ms=1.0)
+    else:
+        os.environ["HF_HUB_OFFLINE"] = "1"
+    pipe = sentiment.get_sentiment_pipeline()
+
+    reviews = make_long_reviews(args.rows)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        clean_texts = [preprocess_text(text) for text, _ in reviews]
+    expected = [label for _, label in reviews]
+
+    def char_cut(texts):
+        # Perilaku lama: clean_text[:512] (karakter)
+        return [pipe(t[:512])[0]["label"].lower() for t in texts]
+
+    def token_truncate(texts):
+        outputs = pipe(texts, batch_size=args.batch_size, truncation=True)
+        return [o["label"].lower() for o in outputs]
+
+    def windowed(texts):
+        return [label for label, _ in sentiment.analyze_sentiment_batch(texts, batch_size=args.batch_size)]
+
+    run("potong 512 karakter", char_cut, clean_texts, expected)
+    run("truncation token", token_truncate, clean_texts, expected)
+    run("jendela token", windowed, clean_texts, expected)
+
+
+if __name__ == "__main__":
+    main()
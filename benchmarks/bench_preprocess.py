@@ -0,0 +1,47 @@
+# benchmarks/bench_preprocess.py
+"""Ukur skala preprocess_batch terhadap jumlah core.
+
+Setiap pengukuran mulai dengan cache stemmer kosong (serial: reset_stemmer,
+worker: stemmer dimuat sekali di initializer), dan processes=1 juga lewat pool.
+
+Jalankan dari root repo:
+    python benchmarks/bench_preprocess.py --rows 50000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from preprocessing import preprocess_batch, preprocess_text, reset_stemmer  # noqa: E402
+from bench_comments_frame import make_records  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    args = parser.parse_args()
+
+    texts = [r["comment_text"] for r in make_records(args.rows)]
+
+    reset_stemmer()
+    start = time.perf_counter()
+    expected = [preprocess_text(t) for t in texts]
+    serial_s = time.perf_counter() - start
+    print(f"serial        {serial_s:8.2f}s  {args.rows / serial_s:10,.0f} review/s")
+
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, 16, cores} & set(range(1, cores + 1)))
+    for processes in counts:
+        reset_stemmer()
+        start = time.perf_counter()
+        results = preprocess_batch(texts, processes=processes, chunk_size=args.chunk_size)
+        elapsed = time.perf_counter() - start
+        assert results == expected, "urutan/hasil tidak sama dengan versi serial"
+        print(f"processes={processes:<3} {elapsed:8.2f}s  {args.rows / elapsed:10,.0f} review/s  "
+              f"speedup={serial_s / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
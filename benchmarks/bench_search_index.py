@@ -0,0 +1,86 @@
+# benchmarks/bench_search_index.py
+"""Ukur backfill search index FTS5 dan latency pencarian seperti di dashboard.
+
+Jalur yang diukur sama dengan tab Analisis: count_search_results (sekali per
+query + filter), lalu search_page (satu halaman terurut di SQLite) dan ambil
+baris halaman itu dari frame lewat index review_id. Jalur lama (semua id cocok + isin ke seluruh frame) ikut diukur
+sebagai pembanding.
+
+Jalankan dari root repo:
+    python benchmarks/bench_search_index.py --rows 1000000
+"""
+import argparse
+import math
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comments_frame import DETAIL_COLUMNS, build_comments_frame  # noqa: E402
+from search_index import count_search_results, search_page, search_reviews, sync_search_index  # noqa: E402
+from bench_comments_frame import make_records  # noqa: E402
+
+QUERIES = ["stnk", "antri", "pajak", "pelayanan lambat", "aplikasi error", "bayar gagal"]
+
+
+def timed(fn, repeat):
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return result, statistics.median(latencies), latencies[min(len(latencies) - 1, math.ceil(len(latencies) * 0.95) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=5000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    records = make_records(args.rows)
+    df = build_comments_frame(records)
+    positions = pd.Index(df["review_id"].astype(object))  # di app: review_positions, sekali per versi data
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench_index.db")
+
+        start = time.perf_counter()
+        sync_search_index(records, path=path, batch_size=args.batch, processes=args.processes)
+        build_s = time.perf_counter() - start
+        print(f"[INFO] Backfill {args.rows} review: {build_s:.1f}s ({args.rows / build_s:,.0f} review/s)")
+
+        for query in QUERIES:
+            total, p50, p95 = timed(lambda: count_search_results(query, path=path), max(1, args.repeat // 5))
+            print(f"{query:<18} COUNT                  p50={p50:8.2f}ms p95={p95:8.2f}ms hasil={total}")
+
+            for sort_by, descending, page in (("created_at", True, 1), ("created_at", True, 50),
+                                              ("created_at", False, 1), ("rating", True, 1), ("rating", True, 200)):
+                def app_path():
+                    ids, _ = search_page(query, page, args.page_size, sort_by, descending, path=path, total=total)
+                    found = positions.get_indexer(ids)
+                    return df.iloc[found[found >= 0]][DETAIL_COLUMNS]
+
+                page_df, p50, p95 = timed(app_path, args.repeat)
+                arah = "turun" if descending else "naik"
+                print(f"{query:<18} {sort_by:<10} {arah:<5} hal {page:<3} p50={p50:8.2f}ms p95={p95:8.2f}ms "
+                      f"baris={len(page_df)}")
+
+            def old_path():
+                ids = search_reviews(query, limit=len(df), path=path)
+                return df[df["review_id"].isin(ids)]
+
+            _, p50, p95 = timed(old_path, max(1, args.repeat // 5))
+            print(f"{query:<18} jalur lama (semua id + isin)  p50={p50:8.2f}ms p95={p95:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
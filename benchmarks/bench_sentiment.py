@@ -0,0 +1,264 @@
+# benchmarks/bench_sentiment.py
+"""Benchmark & regression suite offline untuk pipeline sentimen.
+
+Mengukur latency p50/p95, throughput, peak RSS dan distribusi label untuk
+tahap preprocess, inference dan jalur update penuh (update_sentiment_in_supabase)
+memakai korpus tetap, model stub (atau model lokal ter-cache) dan Supabase palsu.
+
+Jalankan dari root repo:
+    python benchmarks/bench_sentiment.py --rows 2000
+    python benchmarks/bench_sentiment.py --model local --compare benchmarks/results/<run>.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import sentiment  # noqa: E402
+from labeling_policy import DEFAULT_POLICY  # noqa: E402
+from preprocessing import preprocess_text, reset_stemmer  # noqa: E402
+from supabase_utils import register_supabase_client  # noqa: E402
+from corpus import REVIEWS, make_corpus  # noqa: E402
+from fake_supabase import FakeSupabase  # noqa: E402
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+
+class StubSentimentPipeline:
+    """Pengganti pipeline HF: skor berbasis kata kunci + delay tetap per teks."""
+
+    tokenizer = None
+    POSITIVE = {"cepat", "ramah", "mudah", "bantu", "bagus", "mantap", "lancar", "nyaman", "bersih", "aman", "terima", "kasih"}
+    NEGATIVE = {"lambat", "error", "gagal", "kecewa", "buruk", "crash", "lama", "down", "jutek", "calo", "lemot", "denda"}
+
+    def __init__(self, delay_ms=5.0):
+        self.delay_ms = delay_ms
+
+    def _scores(self, text):
+        tokens = set(text.split())
+        pos, neg = len(tokens & self.POSITIVE), len(tokens & self.NEGATIVE)
+        total = pos + neg + 1
+        return {"LABEL_0": pos / total, "LABEL_1": neg / total, "LABEL_2": 1 / total}
+
+    def __call__(self, inputs, top_k=1, truncation=False, **kwargs):
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        if truncation:
+            # Tiru batas panjang model: kata dianggap token
+            texts = [" ".join(t.split()[:sentiment.MAX_TOKENS]) for t in texts]
+        time.sleep(self.delay_ms / 1000 * len(texts))
+        results = []
+        for text in texts:
+            scores = sorted(self._scores(text).items(), key=lambda kv: kv[1], reverse=True)
+            ranked = [{"label": label, "score": score} for label, score in scores]
+            results.append(ranked if top_k is None else ranked[0])
+        return results
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def summarize(latencies_ms, elapsed_s, count, labels=None):
+    latencies_ms = sorted(latencies_ms)
+    return {
+        "count": count,
+        "p50_ms": statistics.median(latencies_ms) if latencies_ms else None,
+        "p95_ms": latencies_ms[max(0, int(len(latencies_ms) * 0.95) - 1)] if latencies_ms else None,
+        "throughput_per_s": count / elapsed_s if elapsed_s else None,
+        "elapsed_s": elapsed_s,
+        "peak_rss_mb": peak_rss_mb(),
+        "labels": dict(labels or {}),
+    }
+
+
+def timed_each(fn, items):
+    latencies, outputs = [], []
+    start = time.perf_counter()
+    for item in items:
+        t0 = time.perf_counter()
+        outputs.append(fn(item))
+        latencies.append((time.perf_counter() - t0) * 1000)
+    return outputs, latencies, time.perf_counter() - start
+
+
+def timed_batches(fn, items, batch_size):
+    """Seperti timed_each, tapi fn dipanggil per batch dan latency dicatat per batch."""
+    latencies, outputs = [], []
+    start = time.perf_counter()
+    for i in range(0, len(items), batch_size):
+        t0 = time.perf_counter()
+        outputs.extend(fn(items[i:i + batch_size]))
+        latencies.append((time.perf_counter() - t0) * 1000)
+    return outputs, latencies, time.perf_counter() - start
+
+
+def reset_caches():
+    """Kosongkan cache stem & cache label, supaya tiap tahap mulai dingin."""
+    reset_stemmer()
+    DEFAULT_POLICY.label_cache.clear()
+
+
+def bench_preprocess(rows):
+    outputs, latencies, elapsed = timed_each(preprocess_text, [r["comment_text"] for r in rows])
+    return outputs, summarize(latencies, elapsed, len(rows))
+
+
+def bench_inference(clean_texts, batch_size=16):
+    # Jalur yang sama dengan aplikasi: jendela token + batch; latency per batch
+    texts = [t for t in clean_texts if t]
+    outputs, latencies, elapsed = timed_batches(
+        lambda batch: sentiment.analyze_sentiment_batch(batch, batch_size=batch_size), texts, batch_size)
+    labels = Counter(sentiment.map_sentiment_label(label) for label, _ in outputs)
+    stats = summarize(latencies, elapsed, len(texts), labels)
+    stats["latency_per"] = f"batch {batch_size}"
+    return stats
+
+
+@contextlib.contextmanager
+def stage_timer(module, name):
+    """Ganti module.name sementara dengan pembungkus yang mencatat (mulai, selesai) tiap panggilan."""
+    fn, spans = getattr(module, name), []
+
+    def timed(*args, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            spans.append((t0, time.perf_counter()))
+
+    setattr(module, name, timed)
+    try:
+        yield spans
+    finally:
+        setattr(module, name, fn)
+
+
+def bench_update_path(rows):
+    fake = FakeSupabase()
+    fake.seed("comments", [
+        {k: v for k, v in r.items() if k != "expected_label"} | {"sentimen_label": None, "sentiment_score": None}
+        for r in rows
+    ])
+    register_supabase_client(fake)
+
+    with stage_timer(sentiment, "plan_labels") as plan, \
+            stage_timer(sentiment, "analyze_sentiment_batch") as inference:
+        start = time.perf_counter()
+        policy_stats = sentiment.update_sentiment_in_supabase()
+        elapsed = time.perf_counter() - start
+
+    # Tahap dicatat terpisah: plan_labels, inference batch, lalu tulis per review.
+    # Latency p50/p95 = satu UPDATE ke database, dihitung setelah inference selesai.
+    writes_start = (inference or plan)[-1][1]
+    updates = [ts for op, _, ts in fake.calls if op == "update"]
+    stamps = [writes_start] + updates
+    latencies = [(b - a) * 1000 for a, b in zip(stamps, stamps[1:])]
+    labels = Counter(r["sentimen_label"] for r in fake.tables["comments"].values())
+    stats = summarize(latencies, elapsed, len(rows), labels)
+    stats["latency_per"] = "update"
+    stats["stage_s"] = {
+        "plan_labels": sum(b - a for a, b in plan),
+        "inference": sum(b - a for a, b in inference),
+        "writes": (updates[-1] - writes_start) if updates else 0.0,
+    }
+    stats["policy"] = policy_stats
+    return stats
+
+
+def accuracy():
+    hits = 0
+    for text, rating, expected in REVIEWS:
+        label, _ = sentiment.analyze_sentiment_with_rating(text, rating)
+        hits += sentiment.map_sentiment_label(label) == expected
+    return hits / len(REVIEWS)
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def compare(current, baseline_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"\nPerbandingan dengan {baseline.get('commit')} ({baseline_path}):")
+    for stage, result in current["stages"].items():
+        old = baseline.get("stages", {}).get(stage)
+        if not old:
+            continue
+        for metric in ("p50_ms", "p95_ms", "throughput_per_s", "peak_rss_mb"):
+            if old.get(metric) and result.get(metric) is not None:
+                change = (result[metric] - old[metric]) / old[metric] * 100
+                print(f"  {stage:<12} {metric:<17} {old[metric]:10.3f} -> {result[metric]:10.3f} ({change:+.1f}%)")
+    print(f"  accuracy {baseline.get('accuracy'):.3f} -> {current['accuracy']:.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--model", choices=["stub", "local"], default="stub",
+                        help="stub = model palsu; local = IndoBERT dari cache HF (offline)")
+    parser.add_argument("--stub-delay-ms", type=float, default=5.0)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--output", help="path file JSON hasil (default: benchmarks/results/)")
+    parser.add_argument("--compare", help="file JSON hasil run sebelumnya untuk dibandingkan")
+    args = parser.parse_args()
+
+    if args.model == "stub":
+        sentiment.sentiment_pipeline = StubSentimentPipeline(delay_ms=args.stub_delay_ms)
+    else:
+        os.environ["HF_HUB_OFFLINE"] = "1"
+
+    rows = make_corpus(args.rows)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        reset_caches()
+        clean_texts, preprocess_stats = bench_preprocess(rows)
+        reset_caches()
+        inference_stats = bench_inference(clean_texts, args.batch_size)
+        reset_caches()
+        update_stats = bench_update_path(rows)
+        acc = accuracy()
+
+    result = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "model": args.model,
+        "rows": args.rows,
+        "distinct_texts": len(set(r["comment_text"] for r in rows)),
+        "accuracy": acc,
+        "stages": {"preprocess": preprocess_stats, "inference": inference_stats, "update_path": update_stats},
+    }
+
+    for stage, stats in result["stages"].items():
+        print(f"{stage:<12} p50={stats['p50_ms']:8.3f}ms p95={stats['p95_ms']:8.3f}ms "
+              f"throughput={stats['throughput_per_s']:9.1f}/s rss={stats['peak_rss_mb']:7.1f}MB "
+              f"labels={stats['labels']}" + (f" (latency per {stats['latency_per']})" if "latency_per" in stats else ""))
+    stage_s = update_stats["stage_s"]
+    print(f"update_path  plan_labels={stage_s['plan_labels']:.3f}s inference={stage_s['inference']:.3f}s "
+          f"writes={stage_s['writes']:.3f}s total={update_stats['elapsed_s']:.3f}s")
+    print(f"accuracy (korpus berlabel): {acc:.3f}, teks unik: {result['distinct_texts']}/{args.rows}")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"sentiment_{result['commit']}_{result['timestamp'].replace(':', '')}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(result, f, indent=2)
+    print(f"[INFO] Hasil disimpan ke {output}")
+
+    if args.compare:
+        compare(result, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# benchmarks/bench_supabase_pool.py
+"""Bandingkan client Supabase baru-per-panggilan vs client bersama ber-pool.
+
+Memakai server PostgREST tiruan di localhost yang menghitung koneksi TCP baru.
+Server tiruan hanya HTTP/1.1 (tanpa TLS), jadi yang diukur adalah keep-alive;
+di Supabase asli httpx akan menegosiasikan HTTP/2 lewat TLS.
+
+Jalankan dari root repo:
+    python benchmarks/bench_supabase_pool.py --requests 500 --threads 8
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from supabase import create_client  # noqa: E402
+from supabase_utils import get_supabase_client, reset_supabase_clients  # noqa: E402
+
+BENCH_KEY = "bench.bench.bench"
+ROWS = json.dumps([{"review_id": f"r{i}", "comment_text": "pelayanan cepat"} for i in range(20)]).encode()
+
+
+class MockPostgrestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with MockPostgrestHandler.lock:
+            MockPostgrestHandler.connections += 1
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(ROWS)))
+        self.end_headers()
+        self.wfile.write(ROWS)
+
+    do_GET = do_POST = do_PATCH = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+def run(label, make_client, url, n_requests, n_threads):
+    MockPostgrestHandler.connections = 0
+    latencies = []
+
+    def one_request(_):
+        start = time.perf_counter()
+        make_client(url).table("comments").select("*").limit(20).execute()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=n_threads) as pool:
+        list(pool.map(one_request, range(n_requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"{label:<22} koneksi baru={MockPostgrestHandler.connections:5d}  "
+          f"p50={statistics.median(latencies):7.2f}ms  p95={latencies[int(len(latencies) * 0.95) - 1]:7.2f}ms  "
+          f"throughput={n_requests / elapsed:8.1f} req/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockPostgrestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        # Perilaku lama: create_client baru setiap kali dipanggil
+        run("client per panggilan", lambda u: create_client(u, BENCH_KEY), url, args.requests, args.threads)
+        run("client bersama (pool)", lambda u: get_supabase_client(u, BENCH_KEY), url, args.requests, args.threads)
+    finally:
+        reset_supabase_clients()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# benchmarks/corpus.py
+"""Korpus tetap review berbahasa Indonesia (teks, rating, label manual) untuk benchmark.
+
+make_corpus menambahkan keterangan netral (kota, kendaraan, waktu) ke tiap review
+supaya teksnya unik: cache stem & label tidak membuat hasil benchmark terlalu bagus.
+"""
+
+REVIEWS = [
+    ("Pelayanan cepat dan petugasnya ramah, bayar pajak cuma 15 menit", 5, "positif"),
+    ("Mantap, proses perpanjangan STNK sekarang jauh lebih mudah", 5, "positif"),
+    ("Aplikasinya membantu sekali, tidak perlu antri lagi di samsat", 5, "positif"),
+    ("Terima kasih, petugas sangat membantu waktu saya bingung isi formulir", 4, "positif"),
+    ("Tempatnya bersih, ruang tunggu nyaman dan ada AC", 4, "positif"),
+    ("Bagus, pembayaran online lancar dan kode bayar langsung keluar", 4, "positif"),
+    ("Pengiriman STNK lewat pos sampai dengan aman, recommended", 5, "positif"),
+    ("Sistem antrian sudah rapi, tidak berdesakan seperti dulu", 4, "positif"),
+    ("Lumayan, tapi parkiran agak sempit", 3, "netral"),
+    ("Prosesnya standar saja, tidak cepat tidak lambat", 3, "netral"),
+    ("Datang jam 8 pagi, selesai sekitar jam 10", 3, "netral"),
+    ("Loket pembayaran ada tiga, loket pengambilan ada dua", 3, "netral"),
+    ("Kadang cepat kadang lama, tergantung hari", 3, "netral"),
+    ("Harus bawa KTP asli dan BPKB untuk cek fisik", None, "netral"),
+    ("Buka hari Sabtu sampai jam 12 siang", None, "netral"),
+    ("Aplikasi sering error, sudah bayar tapi status belum berubah", 1, "negatif"),
+    ("Antri lama sekali, petugas lambat dan tidak jelas informasinya", 1, "negatif"),
+    ("Gagal verifikasi terus padahal data KTP sudah benar", 1, "negatif"),
+    ("STNK tidak sampai sudah dua minggu, CS tidak merespon", 2, "negatif"),
+    ("Kecewa, live chat tidak pernah dibalas", 2, "negatif"),
+    ("Bayar pajak online gagal terus, saldo terpotong tapi transaksi tidak tercatat", 1, "negatif"),
+    ("Aplikasi crash setiap kali upload foto", 1, "negatif"),
+    ("Koneksi server sering down, tidak bisa login", 2, "negatif"),
+    ("Pelayanan buruk, ada calo di depan loket", 1, "negatif"),
+    ("Petugas jutek dan tidak ramah", None, "negatif"),
+    ("Sangat lambat, sudah antri dari pagi belum dipanggil", None, "negatif"),
+    ("Proses cepat, petugas informatif, mantap", None, "positif"),
+    ("Sudah bagus tapi aplikasi kadang lemot saat jam sibuk", 3, "netral"),
+    ("", 4, "positif"),
+    ("", None, "netral"),
+    ("Keluhan saya tentang pajak kendaraan yang terlambat dihitung denda padahal sistem error "
+     "waktu jatuh tempo, sudah lapor ke CS tapi disuruh datang langsung ke kantor, sampai sana "
+     "antri lagi dan akhirnya tetap harus bayar denda, sangat mengecewakan", 1, "negatif"),
+    ("Awalnya ragu pakai aplikasi ini karena banyak review jelek, ternyata prosesnya lancar, "
+     "verifikasi wajah berhasil sekali coba, bayar lewat mobile banking, dan STNK dikirim "
+     "ke rumah tiga hari kemudian, terima kasih samsat", 5, "positif"),
+]
+
+
+# Kata-kata netral (tidak ada di daftar kata stub / kamus sentimen); kombinasi
+# REVIEWS x CITIES x VEHICLES x PLACES x TIMES = 768 ribu teks unik
+CITIES = [
+    "bandung", "bekasi", "bogor", "depok", "cimahi", "garut", "tasikmalaya", "cirebon",
+    "sukabumi", "karawang", "purwakarta", "subang", "sumedang", "majalengka", "kuningan",
+    "indramayu", "ciamis", "banjar", "pangandaran", "cianjur",
+]
+VEHICLES = ["motor", "mobil", "truk", "pikap", "minibus", "skuter", "jip", "sedan", "bus", "ambulans"]
+PLACES = [
+    "kantor pusat", "gerai mal", "samsat keliling", "samsat corner", "drive thru",
+    "gerai kecamatan", "kantor cabang", "loket bank", "gerai desa", "stan pameran",
+]
+TIMES = [
+    "januari", "februari", "maret", "april", "mei", "juni",
+    "juli", "agustus", "september", "oktober", "november", "desember",
+]
+
+
+def describe(i):
+    """Keterangan netral ke-i (unik untuk i < jumlah kombinasi)."""
+    i, city = divmod(i, len(CITIES))
+    i, vehicle = divmod(i, len(VEHICLES))
+    i, place = divmod(i, len(PLACES))
+    time = TIMES[i % len(TIMES)]
+    return f"Urus {VEHICLES[vehicle]} plat {CITIES[city]}, {PLACES[place]} bulan {time}"
+
+
+def make_corpus(n):
+    """n review dengan review_id & teks unik (review kosong tetap kosong)."""
+    rows = []
+    for i in range(n):
+        text, rating, label = REVIEWS[i % len(REVIEWS)]
+        if text:
+            text = f"{text}. {describe(i // len(REVIEWS))}"
+        rows.append({
+            "review_id": f"bench-{i:07d}",
+            "source": "gmaps" if i % 2 else "playstore",
+            "username": f"user{i % 97}",
+            "comment_text": text,
+            "rating": rating,
+            "expected_label": label,
+        })
+    return rows
@@ -0,0 +1,272 @@
+# benchmarks/fake_supabase.py
+"""Pengganti Supabase client di memori untuk benchmark & load test.
+
+Hanya mendukung subset query builder postgrest yang dipakai repo ini:
+select/insert/upsert/update/delete + eq/neq/is_/in_/ilike/gt/gte/lt/lte,
+or_ (sintaks filter PostgREST, termasuk and(...)), order, range, limit, dan
+count="exact" (dengan head=True). Penulisan bisa diteruskan ke
+subscriber (subscribe_changes) sebagai pengganti Supabase Realtime.
+"""
+import re
+import threading
+import time
+
+
+OPERATORS = {
+    "eq": lambda a, b: a == b,
+    "neq": lambda a, b: a != b,
+    "lt": lambda a, b: a < b,
+    "lte": lambda a, b: a <= b,
+    "gt": lambda a, b: a > b,
+    "gte": lambda a, b: a >= b,
+}
+
+
+def split_filters(text):
+    """Pisah "a,and(b,c),d" di koma level teratas (di luar kurung & tanda kutip)."""
+    parts, depth, quoted, current = [], 0, False, ""
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if quoted and ch == "\\":
+            current += text[i:i + 2]
+            i += 2
+            continue
+        if ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == "(":
+            depth += 1
+        elif not quoted and ch == ")":
+            depth -= 1
+        elif not quoted and depth == 0 and ch == ",":
+            parts.append(current)
+            current = ""
+            i += 1
+            continue
+        current += ch
+        i += 1
+    parts.append(current)
+    return parts
+
+
+def parse_filter(text):
+    """Satu filter PostgREST (col.op.value, and(...), or(...)) jadi predicate baris."""
+    for logic, combine in (("and(", all), ("or(", any)):
+        if text.startswith(logic) and text.endswith(")"):
+            preds = [parse_filter(part) for part in split_filters(text[len(logic):-1])]
+            return lambda r: combine(p(r) for p in preds)
+
+    column, op, value = text.split(".", 2)
+    if value.startswith('"') and value.endswith('"'):
+        value = re.sub(r"\\(.)", r"\1", value[1:-1])
+    if op == "is":
+        return lambda r: r.get(column) is None if value == "null" else r.get(column) is value
+
+    def matches(r):
+        current = r.get(column)
+        if current is None:
+            return False
+        # Nilai filter selalu teks; samakan tipenya dengan kolom (angka dibandingkan sebagai angka)
+        if isinstance(current, (int, float)):
+            return OPERATORS[op](float(current), float(value))
+        return OPERATORS[op](str(current), value)
+    return matches
+
+
+class FakeResponse:
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    def __init__(self, client, table):
+        self._client = client
+        self._table = table
+        self._op = "select"
+        self._payload = None
+        self._count = None
+        self._filters = []
+        self._order = []
+        self._range = None
+        self._limit = None
+        self._columns = None
+        self._head = None
+        self._key = None  # nilai primary key jika difilter eq(), untuk lookup langsung
+
+    # --- operasi ---
+    def select(self, columns="*", count=None, head=None):
+        self._op = "select"
+        self._columns = None if columns.strip() == "*" else [c.strip() for c in columns.split(",")]
+        self._count = count
+        self._head = head
+        return self
+
+    def insert(self, data):
+        self._op, self._payload = "upsert", data
+        return self
+
+    def upsert(self, data, on_conflict=None):
+        self._op, self._payload = "upsert", data
+        return self
+
+    def update(self, data):
+        self._op, self._payload = "update", data
+        return self
+
+    def delete(self):
+        self._op = "delete"
+        return self
+
+    # --- filter ---
+    def _where(self, fn):
+        self._filters.append(fn)
+        return self
+
+    def eq(self, column, value):
+        if column == self._client.primary_key:
+            self._key = value
+        return self._where(lambda r: r.get(column) == value)
+
+    def neq(self, column, value):
+        return self._where(lambda r: r.get(column) != value)
+
+    def is_(self, column, value):
+        if value is None or str(value).lower() == "null":
+            return self._where(lambda r: r.get(column) is None)
+        return self._where(lambda r: r.get(column) is value)
+
+    def in_(self, column, values):
+        values = set(values)
+        return self._where(lambda r: r.get(column) in values)
+
+    def ilike(self, column, pattern):
+        regex = re.compile("^" + ".*".join(map(re.escape, pattern.split("%"))) + "$", re.I | re.S)
+        return self._where(lambda r: isinstance(r.get(column), str) and bool(regex.match(r[column])))
+
+    def or_(self, filters):
+        return self._where(parse_filter(f"or({filters})"))
+
+    def _compare(self, column, value, op):
+        return self._where(lambda r: r.get(column) is not None and op(r[column], value))
+
+    def gt(self, column, value):
+        return self._compare(column, value, lambda a, b: a > b)
+
+    def gte(self, column, value):
+        return self._compare(column, value, lambda a, b: a >= b)
+
+    def lt(self, column, value):
+        return self._compare(column, value, lambda a, b: a < b)
+
+    def lte(self, column, value):
+        return self._compare(column, value, lambda a, b: a <= b)
+
+    # --- urutan & halaman ---
+    def order(self, column, desc=False, **kwargs):
+        self._order.append((column, desc))
+        return self
+
+    def range(self, start, end):
+        self._range = (start, end)
+        return self
+
+    def limit(self, size):
+        self._limit = size
+        return self
+
+    def _matches(self, row):
+        return all(fn(row) for fn in self._filters)
+
+    def execute(self):
+        return self._client._execute(self)
+
+
+class FakeSupabase:
+    """Client palsu; baris disimpan per tabel dalam dict berkunci primary key."""
+
+    def __init__(self, tables=None, primary_key="review_id", latency_ms=0.0):
+        self.primary_key = primary_key
+        self.latency_ms = latency_ms
+        self.tables = {}
+        self.calls = []  # (operasi, tabel, timestamp perf_counter)
+        self._lock = threading.RLock()
+        self._subscribers = {}  # tabel -> [callback(type, record, old_record)]
+        for name, rows in (tables or {}).items():
+            self.seed(name, rows)
+
+    def seed(self, table, rows):
+        with self._lock:
+            store = self.tables.setdefault(table, {})
+            for row in rows:
+                store[row[self.primary_key]] = dict(row)
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def subscribe_changes(self, table, callback):
+        with self._lock:
+            self._subscribers.setdefault(table, []).append(callback)
+
+    def _notify(self, table, events):
+        for callback in self._subscribers.get(table, []):
+            for event_type, record, old_record in events:
+                callback(event_type, record, old_record)
+
+    def _execute(self, query):
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+        events = []
+        response = self._apply(query, events)
+        if events:
+            self._notify(query._table, events)
+        return response
+
+    def _apply(self, query, events):
+        with self._lock:
+            self.calls.append((query._op, query._table, time.perf_counter()))
+            store = self.tables.setdefault(query._table, {})
+
+            if query._op == "upsert":
+                payload = query._payload if isinstance(query._payload, list) else [query._payload]
+                saved = []
+                for row in payload:
+                    old = store.get(row[self.primary_key])
+                    merged = {**(old or {}), **row}
+                    store[row[self.primary_key]] = merged
+                    saved.append(dict(merged))
+                    events.append(("UPDATE" if old else "INSERT", dict(merged), dict(old or {})))
+                return FakeResponse(saved)
+
+            candidates = store.values() if query._key is None else [store[query._key]] if query._key in store else []
+            rows = [r for r in candidates if query._matches(r)]
+
+            if query._op == "update":
+                for r in rows:
+                    old = dict(r)
+                    r.update(query._payload)
+                    events.append(("UPDATE", dict(r), old))
+                return FakeResponse([dict(r) for r in rows])
+
+            if query._op == "delete":
+                for r in rows:
+                    del store[r[self.primary_key]]
+                    events.append(("DELETE", {}, dict(r)))
+                return FakeResponse([dict(r) for r in rows])
+
+            total = len(rows)
+            for column, desc in reversed(query._order):
+                present = sorted((r for r in rows if r.get(column) is not None),
+                                 key=lambda r: r[column], reverse=desc)
+                rows = present + [r for r in rows if r.get(column) is None]
+            if query._range:
+                rows = rows[query._range[0]:query._range[1] + 1]
+            if query._limit is not None:
+                rows = rows[:query._limit]
+
+            columns = query._columns
+            if query._head:
+                return FakeResponse([], total if query._count else None)
+            data = [{c: r.get(c) for c in columns} if columns else dict(r) for r in rows]
+            return FakeResponse(data, total if query._count else None)
@@ -0,0 +1,311 @@
+# benchmarks/load_test_dashboard.py
+"""Load test dashboard: banyak sesi Streamlit bersamaan terhadap Supabase palsu.
+
+app.py dijalankan headless lewat streamlit.testing.v1.AppTest. Setiap sesi
+berpindah tab, mengganti filter sumber dan mencari komentar secara acak;
+latency render per tab (p50/p95) dan peak RSS dilaporkan untuk setiap
+kombinasi jumlah data x jumlah sesi.
+
+Jalankan dari root repo:
+    python benchmarks/load_test_dashboard.py --rows 1000,10000 --sessions 1,4,8
+    python benchmarks/load_test_dashboard.py --live --writes-per-s 5
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+APP_PATH = os.path.join(ROOT, "app.py")
+
+TABS = ["Home", "Analisis", "Visualisasi", "Tentang"]
+TAB_KEY = "_load_test_tab"
+SEARCH_TERMS = ["pelayanan", "antri", "aplikasi error", "petugas ramah", "pajak"]
+# Judul yang selalu tampil di tiap tab (st.header atau markdown <h2>)
+TAB_MARKERS = {
+    "Home": "Analisis Sentimen Review",
+    "Analisis": "Analisis Komentar",
+    "Visualisasi": "Visualisasi Sentimen",
+    "Tentang": "Tentang",
+}
+
+
+def patch_option_menu():
+    """option_menu adalah komponen custom (tidak bisa diklik di AppTest): tab dibaca dari session_state."""
+    import streamlit as st
+    import streamlit_option_menu
+
+    def option_menu(menu_title, options, default_index=0, **kwargs):
+        return st.session_state.get(TAB_KEY, options[default_index])
+
+    streamlit_option_menu.option_menu = option_menu
+
+
+def share_test_runtime(secrets):
+    """AppTest memasang & melepas Runtime tiruan dan st.secrets global di setiap run,
+    sehingga tidak aman dipakai dari beberapa thread. Pasang satu Runtime tiruan
+    bersama (seperti satu server Streamlit dengan banyak sesi) dan secrets sekali saja.
+    """
+    from unittest.mock import MagicMock
+
+    import streamlit as st
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.runtime.secrets import Secrets
+    from streamlit.testing.v1 import app_test
+
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime._instance = runtime
+    # Assignment Runtime._instance di dalam AppTest jatuh ke subclass ini, bukan ke Runtime
+    app_test.Runtime = type("SharedTestRuntime", (Runtime,), {})
+
+    shared_secrets = Secrets()
+    shared_secrets._secrets = dict(secrets)
+    st.secrets = shared_secrets
+
+
+def current_rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class RssSampler(threading.Thread):
+    """Catat RSS tertinggi selama satu skenario."""
+
+    def __init__(self, interval_s=0.02):
+        super().__init__(daemon=True)
+        self.interval_s = interval_s
+        self.peak_mb = current_rss_mb()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval_s):
+            self.peak_mb = max(self.peak_mb, current_rss_mb())
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        self.peak_mb = max(self.peak_mb, current_rss_mb())
+        return self.peak_mb
+
+
+def new_app(timeout):
+    from streamlit.testing.v1 import AppTest
+
+    return AppTest.from_file(APP_PATH, default_timeout=timeout)
+
+
+def find_widget(widgets, label):
+    return next((w for w in widgets if w.label == label), None)
+
+
+def rendered_tab(at, tab):
+    """True jika judul tab ada di hasil render.
+
+    Error kompilasi script (mis. SyntaxError/SystemError dari ast.parse) tidak
+    masuk at.exception; yang tersisa hanya tree kosong.
+    """
+    if not at.main.children:
+        return False
+    texts = [e.value for e in at.header] + [e.value for e in at.markdown]
+    return any(TAB_MARKERS[tab] in text for text in texts)
+
+
+def timed_run(at, name, tab, latencies, errors):
+    # Run yang gagal dicatat sebagai error dan tidak ikut dihitung di latency
+    start = time.perf_counter()
+    try:
+        at.run()
+    except RuntimeError as e:  # timeout AppTest
+        errors.append(f"{name}: {e}")
+        return
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if at.exception:
+        errors.extend(f"{name}: {e.value}" for e in at.exception)
+    elif not rendered_tab(at, tab):
+        errors.append(f"{name}: tab tidak ter-render (tree kosong atau judul '{TAB_MARKERS[tab]}' tidak ada)")
+    else:
+        latencies[name].append(elapsed_ms)
+
+
+def run_session(seed, steps, timeout, latencies, errors):
+    rng = random.Random(seed)
+    at = new_app(timeout)
+    timed_run(at, "Home", "Home", latencies, errors)
+
+    for _ in range(steps):
+        tab = rng.choice(TABS)
+        at.session_state[TAB_KEY] = tab
+        timed_run(at, tab, tab, latencies, errors)
+
+        source = find_widget(at.selectbox, "Pilih Sumber")
+        if source is not None and rng.random() < 0.5:
+            source.set_value(rng.choice(source.options))
+            timed_run(at, f"{tab} (filter)", tab, latencies, errors)
+
+        search = find_widget(at.text_input, "Cari komentar")
+        if search is not None and rng.random() < 0.3:
+            search.set_value(rng.choice(SEARCH_TERMS))
+            timed_run(at, f"{tab} (cari)", tab, latencies, errors)
+
+
+def write_reviews(client, rate_per_s, stop_event, start_index):
+    """Tulis review baru ke Supabase palsu selama load test (uji jalur live update)."""
+    from bench_comments_frame import make_records
+
+    i = start_index
+    while not stop_event.wait(1 / rate_per_s):
+        row = make_records(1, seed=i)[0]
+        row["review_id"] = f"rev-live-{i:08d}"
+        row["created_at"] = datetime.now(timezone.utc).isoformat()
+        client.table("comments").upsert(row).execute()
+        i += 1
+
+
+def reset_backend(rows, latency_ms):
+    import streamlit as st
+    from supabase_utils import register_supabase_client, reset_supabase_clients
+    from bench_comments_frame import make_records
+    from fake_supabase import FakeSupabase
+
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    reset_supabase_clients()
+    client = FakeSupabase({"comments": make_records(rows)}, latency_ms=latency_ms)
+    register_supabase_client(client)
+    return client
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[max(0, int(round(len(values) * q)) - 1)]
+
+
+def run_scenario(client, rows, sessions, steps, timeout, writes_per_s):
+    latencies, errors = defaultdict(list), []
+    stop_writes = threading.Event()
+    writer = None
+    if writes_per_s:
+        writer = threading.Thread(target=write_reviews, args=(client, writes_per_s, stop_writes, rows * 10), daemon=True)
+        writer.start()
+
+    sampler = RssSampler()
+    sampler.start()
+    start = time.perf_counter()
+    threads = [
+        threading.Thread(target=run_session, args=(rows * 1000 + i, steps, timeout, latencies, errors))
+        for i in range(sessions)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    peak_mb = sampler.stop()
+    stop_writes.set()
+    if writer is not None:
+        writer.join()
+
+    return {
+        "rows": rows,
+        "sessions": sessions,
+        "elapsed_s": elapsed,
+        "peak_rss_mb": peak_mb,
+        "errors": errors[:20],
+        "error_count": len(errors),
+        "tabs": {
+            name: {
+                "count": len(values),
+                "p50_ms": statistics.median(values),
+                "p95_ms": percentile(values, 0.95),
+                "max_ms": max(values),
+            }
+            for name, values in sorted(latencies.items())
+        },
+    }
+
+
+def print_scenario(result):
+    print(f"\n== {result['rows']} review, {result['sessions']} sesi: "
+          f"{result['elapsed_s']:.1f} s, peak RSS {result['peak_rss_mb']:.0f} MB, {result['error_count']} error")
+    for name, stats in result["tabs"].items():
+        print(f"  {name:<24} n={stats['count']:<4} p50={stats['p50_ms']:8.1f}ms "
+              f"p95={stats['p95_ms']:8.1f}ms max={stats['max_ms']:8.1f}ms")
+    for error in result["errors"][:3]:
+        print(f"  [ERROR] {error[:200]}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", default="1000,10000", help="jumlah review, dipisah koma")
+    parser.add_argument("--sessions", default="1,4,8", help="jumlah sesi bersamaan, dipisah koma")
+    parser.add_argument("--steps", type=int, default=10, help="jumlah pindah tab per sesi")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="latency tiap query ke Supabase palsu")
+    parser.add_argument("--live", action="store_true", help="jalankan dengan LIVE_UPDATES=1 (change feed lokal)")
+    parser.add_argument("--writes-per-s", type=float, default=0.0, help="review baru per detik selama test")
+    parser.add_argument("--timeout", type=float, default=300.0, help="batas waktu satu rerun (detik)")
+    parser.add_argument("--output", help="path file JSON hasil (default: benchmarks/results/)")
+    args = parser.parse_args()
+
+    # Semua state disk & env diset sebelum modul aplikasi di-import
+    workdir = tempfile.mkdtemp(prefix="load_test_")
+    os.environ["SEARCH_INDEX_PATH"] = os.path.join(workdir, "comments_index.db")
+    os.environ["COMMENTS_ARCHIVE_DIR"] = os.path.join(workdir, "archive")
+    os.environ["LIVE_UPDATES"] = "1" if args.live else "0"
+    patch_option_menu()
+    share_test_runtime({"PLAYSTORE_PACKAGE": "app.signal.id"})
+    from bench_sentiment import RESULTS_DIR, git_commit
+
+    results = []
+    for rows in [int(r) for r in args.rows.split(",")]:
+        client = reset_backend(rows, args.latency_ms)
+        # Sesi pemanasan: import modul + load data pertama (cache dingin) dicatat terpisah
+        warmup = defaultdict(list)
+        warmup_errors = []
+        run_session(0, 0, args.timeout, warmup, warmup_errors)
+        cold_start_ms = warmup["Home"][0] if warmup["Home"] else None
+        if cold_start_ms is None:
+            print(f"\n[ERROR] {rows} review: render pertama gagal: {warmup_errors[0][:200]}")
+        else:
+            print(f"\n[INFO] {rows} review: render pertama (cache dingin) {cold_start_ms:.0f} ms")
+
+        for sessions in [int(s) for s in args.sessions.split(",")]:
+            result = run_scenario(client, rows, sessions, args.steps, args.timeout, args.writes_per_s)
+            result["cold_start_ms"] = cold_start_ms
+            print_scenario(result)
+            results.append(result)
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "live": args.live,
+        "writes_per_s": args.writes_per_s,
+        "latency_ms": args.latency_ms,
+        "steps": args.steps,
+        "scenarios": results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"load_test_{report['commit']}_{report['timestamp'].replace(':', '')}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n[INFO] Hasil disimpan ke {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+# change_feed.py
+"""Update data dashboard lewat push: perubahan tabel comments dikirim ke aplikasi.
+
+SupabaseChangeFeed berlangganan postgres_changes lewat Supabase Realtime;
+LocalChangeFeed adalah pengganti di proses yang sama untuk benchmark & load
+test. Keduanya memanggil satu callback dengan event yang sudah dinormalisasi:
+    {"type": "INSERT" | "UPDATE" | "DELETE", "record": {...}, "old_record": {...}}
+
+LiveComments memegang DataFrame comments di memori dan menerapkan event
+tersebut sebagai delta per review_id, tanpa mengambil ulang seluruh tabel.
+Feed dijalankan sebelum snapshot diambil: event yang datang selama snapshot
+diantrikan lalu diputar ulang di atasnya (upsert per review_id, aman diulang).
+"""
+import asyncio
+import os
+import threading
+from collections import deque
+
+import pandas as pd
+
+from comments_frame import build_comments_frame
+
+LIVE_UPDATES = os.environ.get("LIVE_UPDATES", "0") == "1"
+LIVE_POLL_SECONDS = float(os.environ.get("LIVE_POLL_SECONDS", 2))
+LIVE_TABLE = "comments"
+ALL_SOURCES = "Semua"
+
+
+def normalize_payload(payload):
+    """Ubah payload postgres_changes dari Realtime ke bentuk event feed."""
+    data = payload.get("data", payload)
+    event_type = getattr(data.get("type"), "value", data.get("type"))
+    return {
+        "type": str(event_type).upper(),
+        "record": data.get("record") or {},
+        "old_record": data.get("old_record") or {},
+    }
+
+
+class LocalChangeFeed:
+    """Feed di proses yang sama; event dikirim lewat publish() atau dari FakeSupabase."""
+
+    def __init__(self, client=None, table=LIVE_TABLE):
+        self.client = client
+        self.table = table
+        self._callbacks = []
+
+    def start(self, callback, on_resync=None, on_down=None):
+        # on_resync/on_down tidak dipakai: feed di proses yang sama tidak pernah terputus
+        self._callbacks.append(callback)
+        if self.client is not None:
+            self.client.subscribe_changes(self.table, self.publish)
+        return self
+
+    def publish(self, event_type, record=None, old_record=None):
+        event = {"type": event_type.upper(), "record": record or {}, "old_record": old_record or {}}
+        for callback in self._callbacks:
+            callback(event)
+
+    def stop(self):
+        self._callbacks.clear()
+
+
+class SupabaseChangeFeed:
+    """Langganan Supabase Realtime di thread terpisah dengan event loop sendiri.
+
+    Tabel comments harus masuk publication supabase_realtime, dan untuk event
+    DELETE butuh REPLICA IDENTITY FULL agar old_record berisi review_id.
+
+    Event selama koneksi putus tidak dikirim ulang oleh Realtime, jadi setiap
+    SUBSCRIBED setelah yang pertama atau setelah gangguan memanggil on_resync.
+    CHANNEL_ERROR, TIMED_OUT, CLOSED dan thread yang berhenti karena error
+    memanggil on_down(alasan), supaya aplikasi bisa kembali ke refresh berkala.
+    """
+
+    def __init__(self, url=None, key=None, table=LIVE_TABLE):
+        self.url = url
+        self.key = key
+        self.table = table
+        self._loop = None
+        self._stopped = None
+        self._thread = None
+
+    def start(self, callback, on_resync=None, on_down=None):
+        self._thread = threading.Thread(target=self._run, args=(callback, on_resync, on_down), daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self, callback, on_resync, on_down):
+        try:
+            asyncio.run(self._listen(callback, on_resync, on_down))
+        except Exception as e:
+            print(f"[WARNING] Langganan realtime '{self.table}' berhenti: {e}")
+            if on_down is not None:
+                on_down(str(e))
+
+    async def _listen(self, callback, on_resync, on_down):
+        from realtime import RealtimeSubscribeStates
+        from supabase import acreate_client
+        from supabase_utils import _resolve_credentials
+
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        client = await acreate_client(*_resolve_credentials(self.url, self.key))
+        subscribed_once = interrupted = False
+
+        def on_state(state, error):
+            nonlocal subscribed_once, interrupted
+            print(f"[INFO] Realtime '{self.table}': {getattr(state, 'value', state)}"
+                  + (f" ({error})" if error else ""))
+            if state == RealtimeSubscribeStates.SUBSCRIBED:
+                if (subscribed_once or interrupted) and on_resync is not None:
+                    on_resync()
+                subscribed_once, interrupted = True, False
+            elif not self._stopped.is_set():
+                # CHANNEL_ERROR / TIMED_OUT / CLOSED; Realtime sendiri akan mencoba join ulang
+                interrupted = True
+                if on_down is not None:
+                    on_down(f"{getattr(state, 'value', state)}" + (f": {error}" if error else ""))
+
+        channel = client.channel(f"live-{self.table}")
+        channel.on_postgres_changes(
+            "*", schema="public", table=self.table,
+            callback=lambda payload: callback(normalize_payload(payload)),
+        )
+        await channel.subscribe(on_state)
+        await self._stopped.wait()
+        await client.remove_channel(channel)
+
+    def stop(self):
+        if self._loop is not None and self._stopped is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+
+
+def create_change_feed(client=None):
+    """LocalChangeFeed untuk client palsu yang bisa memberi notifikasi, selain itu Supabase Realtime."""
+    if client is not None and hasattr(client, "subscribe_changes"):
+        return LocalChangeFeed(client)
+    return SupabaseChangeFeed()
+
+
+class LiveComments:
+    """DataFrame comments yang diperbarui dari event feed.
+
+    Event dari thread feed hanya diantrikan (push); apply_pending() dipanggil
+    dari sisi Streamlit untuk menerapkannya. Versi dihitung per source, jadi
+    view turunan (chart, dsb.) milik source lain tetap valid di cache.
+
+    Setelah feed tersambung ulang, request_resync() menandai frame untuk
+    diganti snapshot baru oleh sisi Streamlit (take_resync + reload).
+    Selama feed_up False (mark_feed_down), frame ini tidak lagi terbaru dan
+    aplikasi sebaiknya memakai jalur refresh biasa.
+    """
+
+    def __init__(self, df=None):
+        self._lock = threading.Lock()
+        self._pending = deque()
+        self._listeners = []
+        self.frame = df if df is not None else pd.DataFrame()
+        self.versions = {}
+        self.applied = 0
+        self.generation = 0
+        self.feed_up = True
+        self._resync = False
+
+    def push(self, event):
+        # Dipanggil dari thread feed
+        self._pending.append(event)
+
+    def has_pending(self):
+        return bool(self._pending) or self._resync
+
+    def request_resync(self):
+        # Dipanggil dari thread feed (reconnect): event selama putus mungkin hilang
+        self._resync = True
+        self.feed_up = True
+
+    def mark_feed_down(self, reason=None):
+        # Dipanggil dari thread feed: langganan gagal atau putus
+        if self.feed_up:
+            print(f"[WARNING] Change feed tidak aktif{f' ({reason})' if reason else ''}; kembali ke refresh berkala.")
+        self.feed_up = False
+
+    def take_resync(self):
+        """True sekali untuk setiap permintaan resync; pemanggil lalu reload snapshot."""
+        with self._lock:
+            resync, self._resync = self._resync, False
+        return resync
+
+    def add_listener(self, fn):
+        """fn(upserted_records, deleted_ids) dipanggil setiap ada delta yang diterapkan."""
+        self._listeners.append(fn)
+
+    def version(self, source=ALL_SOURCES):
+        return f"live-{self.versions.get(source or ALL_SOURCES, 0)}"
+
+    def reload(self, df):
+        """Ganti seluruh frame dengan snapshot baru; semua versi naik.
+
+        Event yang masih antri tidak dibuang: bisa jadi datang setelah snapshot
+        dibaca, jadi tetap diterapkan oleh apply_pending berikutnya.
+        """
+        with self._lock:
+            self.frame = df
+            self.generation += 1
+            for source in list(self.versions) + [ALL_SOURCES]:
+                self.versions[source] = self.versions.get(source, 0) + 1
+
+    def apply_pending(self):
+        """Terapkan event yang antri ke frame. Return set source yang berubah."""
+        with self._lock:
+            events = []
+            while self._pending:
+                events.append(self._pending.popleft())
+            if not events:
+                return set()
+
+            # Event terakhir per review_id yang menang
+            upserts, deletes = {}, set()
+            for event in events:
+                if event["type"] == "DELETE":
+                    review_id = event["old_record"].get("review_id")
+                    if review_id is not None:
+                        deletes.add(review_id)
+                        upserts.pop(review_id, None)
+                else:
+                    review_id = event["record"].get("review_id")
+                    if review_id is not None:
+                        upserts[review_id] = event["record"]
+                        deletes.discard(review_id)
+
+            frame = self.frame
+            touched_ids = set(upserts) | deletes
+            affected = set()
+            if not frame.empty:
+                touched = frame["review_id"].isin(touched_ids)
+                affected.update(frame.loc[touched, "source"].dropna().astype(str))
+                frame = frame[~touched]
+
+            delta = build_comments_frame(list(upserts.values()))
+            if not delta.empty:
+                affected.update(delta["source"].dropna().astype(str))
+                frame = concat_comments(frame, delta)
+
+            self.frame = frame
+            self.applied += len(events)
+            for source in affected | {ALL_SOURCES}:
+                self.versions[source] = self.versions.get(source, 0) + 1
+
+        for fn in self._listeners:
+            fn(list(upserts.values()), deletes)
+        return affected
+
+
+def concat_comments(base, delta):
+    """Gabung dua frame comments bertipe tanpa kehilangan dtype category, urut created_at terbaru."""
+    if base.empty:
+        return delta
+    base, delta = base.copy(deep=False), delta.copy(deep=False)
+    for col in base.columns:
+        if isinstance(base[col].dtype, pd.CategoricalDtype) and col in delta.columns:
+            categories = base[col].cat.categories.union(delta[col].astype("category").cat.categories)
+            base[col] = base[col].cat.set_categories(categories)
+            delta[col] = delta[col].astype(pd.CategoricalDtype(categories))
+    frame = pd.concat([base, delta], ignore_index=True)
+    return frame.sort_values("created_at", ascending=False, na_position="last", kind="stable").reset_index(drop=True)
@@ -0,0 +1,98 @@
+# chart_cache.py
+import io
+import threading
+import time
+from collections import OrderedDict
+
+import matplotlib.pyplot as plt
+import plotly.io as pio
+
+
+def data_version(df):
+    """Versi data untuk key cache; berubah jika ada baris baru atau label diproses ulang."""
+    if df.empty:
+        return "empty"
+    return f"{len(df)}-{df['created_at'].max()}-{df['processed_at'].max()}"
+
+
+class ChartCache:
+    """LRU cache hasil render chart, key = (jenis chart, filter sumber, versi data).
+
+    Matplotlib disimpan sebagai PNG (figure langsung ditutup). Plotly disimpan
+    sebagai objek Figure dan hanya dibaca: JSON spec atau dict harus dibangun
+    ulang jadi Figure oleh st.plotly_chart, sering lebih lambat dari build-nya.
+    render_saved_s adalah lama build dikurangi lama jalur hit.
+    """
+
+    def __init__(self, max_items=64):
+        self.max_items = max_items
+        self._items = OrderedDict()  # key -> (payload, lama render dalam detik, ukuran byte)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.render_saved_s = 0.0
+
+    def _get(self, key):
+        start = time.perf_counter()
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            self.render_saved_s += item[1] - (time.perf_counter() - start)
+            return item[0]
+
+    def _put(self, key, payload, render_s, size):
+        with self._lock:
+            self._items[key] = (payload, render_s, size)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def matplotlib_png(self, key, build_fig, dpi=110):
+        """PNG bytes dari figure matplotlib hasil build_fig() (b"" jika build_fig return None)."""
+        payload = self._get(key)
+        if payload is not None:
+            return payload
+
+        start = time.perf_counter()
+        fig = build_fig()
+        if fig is None:
+            payload = b""  # tidak ada yang digambar, tetap di-cache
+        else:
+            try:
+                buf = io.BytesIO()
+                fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight")
+            finally:
+                plt.close(fig)
+            payload = buf.getvalue()
+        self._put(key, payload, time.perf_counter() - start, len(payload))
+        return payload
+
+    def plotly_figure(self, key, build_fig):
+        """Figure plotly hasil build_fig(), dipakai bersama antar sesi: jangan diubah."""
+        fig = self._get(key)
+        if fig is not None:
+            return fig
+
+        start = time.perf_counter()
+        fig = build_fig()
+        render_s = time.perf_counter() - start
+        self._put(key, fig, render_s, len(pio.to_json(fig, validate=False)))
+        return fig
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "items": len(self._items),
+                "hits": self.hits,
+                "misses": self.misses,
+                "render_saved_s": self.render_saved_s,
+                "resident_bytes": sum(size for _, _, size in self._items.values()),
+            }
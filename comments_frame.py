@@ -0,0 +1,152 @@
+# comments_frame.py
+import pandas as pd
+import dateparser
+
+try:
+    import pyarrow  # noqa: F401
+    TEXT_DTYPE = "string[pyarrow]"
+except ImportError:
+    TEXT_DTYPE = "string"
+    print("⚠️ Module pyarrow belum terinstall, kolom teks memakai string biasa.")
+
+# Skema kolom tabel comments: kolom berkardinalitas rendah jadi category,
+# angka memakai tipe nullable yang kecil, teks memakai string Arrow.
+COMMENT_SCHEMA = {
+    "review_id": TEXT_DTYPE,
+    "source": "category",
+    "username": TEXT_DTYPE,
+    "comment_text": TEXT_DTYPE,
+    "rating": "Int8",
+    "sentimen_label": "category",
+    "sentiment_score": "Float32",
+    "created_at": "datetime64[ns]",
+    "processed_at": "datetime64[ns]",
+}
+
+
+def parse_timestamps(series):
+    """Parse kolom waktu ISO dari Supabase; dateparser hanya untuk sisa yang gagal."""
+    parsed = pd.to_datetime(series, errors="coerce", utc=True, format="ISO8601")
+    leftover = parsed.isna() & series.notna()
+    if leftover.any():
+        parsed[leftover] = pd.to_datetime(
+            series[leftover].map(lambda x: dateparser.parse(str(x))),
+            errors="coerce",
+            utc=True,
+        )
+    return parsed.dt.tz_localize(None).astype("datetime64[ns]")
+
+
+def enforce_comment_schema(df):
+    for col, dtype in COMMENT_SCHEMA.items():
+        if col not in df.columns:
+            df[col] = None
+
+        if dtype.startswith("datetime"):
+            df[col] = parse_timestamps(df[col])
+        elif dtype == "Int8":
+            df[col] = pd.to_numeric(df[col], errors="coerce").round().astype("Int8")
+        elif dtype == "Float32":
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("Float32")
+        else:
+            df[col] = df[col].astype(dtype)
+    return df
+
+
+def build_comments_frame(records):
+    """Bangun DataFrame comments bertipe dari list dict hasil query Supabase."""
+    if not records:
+        return pd.DataFrame()
+
+    df = enforce_comment_schema(pd.DataFrame.from_records(records))
+    df = df.sort_values("created_at", ascending=False, na_position="last").reset_index(drop=True)
+    return df
+
+
+DETAIL_COLUMNS = ["source", "username", "comment_text", "rating",
+                  "sentimen_label", "sentiment_score", "created_at"]
+
+
+def _filter_comments(query, source=None, search=None):
+    if source:
+        query = query.eq("source", source)
+    if search:
+        query = query.ilike("comment_text", f"%{search}%")
+    return query
+
+
+def _postgrest_value(value):
+    # Dikutip supaya koma, titik dua dan kurung di nilai (mis. timestamp) aman di filter or
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+
+def keyset_filter(sort_by, descending, cursor):
+    """Filter PostgREST (untuk or_) berisi baris sesudah cursor (nilai sort, review_id).
+
+    Urutannya sama dengan fetch_comments_page: sort_by naik/turun dengan NULL di
+    akhir, lalu review_id naik.
+    """
+    value, review_id = cursor
+    after_id = f"review_id.gt.{_postgrest_value(review_id)}"
+    if value is None:
+        return f"and({sort_by}.is.null,{after_id})"
+    value = _postgrest_value(value)
+    op = "lt" if descending else "gt"
+    return f"{sort_by}.{op}.{value},and({sort_by}.eq.{value},{after_id}),{sort_by}.is.null"
+
+
+def _ordered_after(query, sort_by, descending, after):
+    if after is not None:
+        query = query.or_(keyset_filter(sort_by, descending, after))
+    return query.order(sort_by, desc=descending, nullsfirst=False).order("review_id")
+
+
+def fetch_comments_page(client, page_size=50, sort_by="created_at", descending=True,
+                        source=None, search=None, after=None):
+    """Ambil satu halaman komentar dari Supabase dengan keyset pagination.
+
+    after adalah cursor halaman sebelumnya (None untuk halaman 1). Return
+    (page_df, cursor halaman ini); cursor None jika halaman kosong. Tanpa
+    OFFSET, biaya per halaman tidak ikut tumbuh dengan ukuran tabel selama ada
+    index (sort_by, review_id) di tabel comments.
+    """
+    columns = DETAIL_COLUMNS + ["review_id"]
+    query = _filter_comments(client.table("comments").select(",".join(columns)), source, search)
+    resp = _ordered_after(query, sort_by, descending, after).limit(page_size).execute()
+
+    rows = resp.data or []
+    cursor = (rows[-1].get(sort_by), rows[-1]["review_id"]) if rows else None
+    page_df = enforce_comment_schema(pd.DataFrame.from_records(rows, columns=columns))
+    return page_df[DETAIL_COLUMNS], cursor
+
+
+def seek_comments_cursor(client, rows, sort_by="created_at", descending=True,
+                         source=None, search=None, after=None):
+    """Cursor sesudah `rows` baris berikutnya, hanya membaca kolom kunci (untuk lompat halaman)."""
+    query = _filter_comments(client.table("comments").select(f"{sort_by},review_id"), source, search)
+    data = _ordered_after(query, sort_by, descending, after).limit(rows).execute().data or []
+    if len(data) < rows:
+        return None
+    return data[-1].get(sort_by), data[-1]["review_id"]
+
+
+def count_comments(client, source=None, search=None):
+    """Jumlah komentar untuk filter (source, search); cukup sekali per filter, bukan per halaman."""
+    query = client.table("comments").select("review_id", count="exact", head=True)
+    return _filter_comments(query, source, search).execute().count or 0
+
+
+def paginate_frame(df, page=1, page_size=50, sort_by="created_at",
+                   descending=True, source=None, search=None):
+    """Versi lokal fetch_comments_page untuk frame yang sudah di-cache."""
+    if source:
+        df = df[df["source"] == source]
+    if search:
+        df = df[df["comment_text"].str.contains(search, case=False, regex=False, na=False)]
+
+    start = (page - 1) * page_size
+    keys = [sort_by] + (["review_id"] if sort_by != "review_id" and "review_id" in df.columns else [])
+    df = df.sort_values(keys, ascending=[not descending] + [True] * (len(keys) - 1),
+                        na_position="last", kind="stable")
+    return df[DETAIL_COLUMNS].iloc[start:start + page_size], len(df)
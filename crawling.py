@@ -6,7 +6,7 @@ from sentiment import save_reviews_to_supabase, update_sentiment_in_supabase
 from datetime import datetime
 import time
 import random
-import dateparser
+from relative_dates import parse_relative_date
 
 # ========================
 # GOOGLE MAPS (SerpApi)
@@ -53,6 +53,9 @@ def run_serpapi_gmaps_paginated(place_id, api_key, max_reviews=15):
 
     print(f"[INFO] Total review yang dikumpulkan: {len(all_reviews[:max_reviews])}")
 
+    # Tanggal dari SerpApi relatif ("2 minggu lalu"), dihitung dari waktu crawl ini
+    crawled_at = datetime.now().replace(microsecond=0)
+
     # Bersihkan hasil
     cleaned_reviews = [
         {
@@ -60,7 +63,9 @@ def run_serpapi_gmaps_paginated(place_id, api_key, max_reviews=15):
             "username": rev.get("user", {}).get("name") if isinstance(rev.get("user"), dict) else rev.get("user"),
             "comment_text": rev.get("snippet"),
             "rating": None if not rev.get("rating") else int(float(rev.get("rating"))),
-            "created_at": None if not rev.get("date") else dateparser.parse(rev.get("date")),
+            "created_at": parse_relative_date(rev.get("date"), anchor=crawled_at),
+            "created_at_text": rev.get("date"),
+            "crawled_at": crawled_at,
         }
         for rev in all_reviews[:max_reviews]
     ]
@@ -154,9 +159,10 @@ def run_crawling_and_analysis(source: str, place_id=None, app_package_name=None,
             print(f"[INFO] Simpan {len(gmaps_results)} review Google Maps ke Supabase...")
             save_reviews_to_supabase(gmaps_results, "gmaps")
 
-            updated = update_sentiment_in_supabase()
+            stats = update_sentiment_in_supabase()
             status_placeholder.success(
-                f"✅ Analisis sentimen Google Maps selesai. {updated} review dianalisis."
+                f"✅ Analisis sentimen Google Maps selesai. {stats['total']} review dianalisis "
+                f"({stats['skipped']} tanpa model, {stats['inferred']} lewat IndoBERT)."
             )
 
     # --------- Google Play Store ---------
@@ -169,9 +175,10 @@ def run_crawling_and_analysis(source: str, place_id=None, app_package_name=None,
 
             if playstore_results:
                 save_reviews_to_supabase(playstore_results, "playstore")
-                updated = update_sentiment_in_supabase()
+                stats = update_sentiment_in_supabase()
                 status_placeholder.success(
-                    f"✅ Analisis sentimen Play Store selesai. {updated} review dianalisis."
+                    f"✅ Analisis sentimen Play Store selesai. {stats['total']} review dianalisis "
+                    f"({stats['skipped']} tanpa model, {stats['inferred']} lewat IndoBERT)."
                 )
             else:
                 status_placeholder.warning("⚠️ Tidak ada review Play Store yang ditemukan.")
@@ -0,0 +1,178 @@
+# inference_service.py
+"""Service inference lokal: satu instance IndoBERT dipakai bersama semua proses.
+
+Request dari banyak pemanggil yang datang dalam jendela waktu singkat
+digabung jadi satu batch ke model.
+
+Jalankan:
+    python inference_service.py --port 8765
+lalu set INFERENCE_SERVICE_URL=http://127.0.0.1:8765 untuk proses Streamlit.
+"""
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+REQUEST_TIMEOUT = float(os.environ.get("INFERENCE_SERVICE_TIMEOUT", 60))
+
+
+class DynamicBatcher:
+    """Kumpulkan teks dari banyak request selama window_ms (maks. max_batch) lalu jalankan sekali."""
+
+    def __init__(self, pipe, window_ms=10.0, max_batch=32):
+        self.pipe = pipe
+        self.window_s = window_ms / 1000
+        self.max_batch = max_batch
+        self.stats = {"requests": 0, "texts": 0, "batches": 0}
+        self._queue = queue.Queue()
+        threading.Thread(target=self._loop, daemon=True).start()
+
+    def submit(self, texts):
+        future = Future()
+        self._queue.put((list(texts), future))
+        return future.result()
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        size = len(batch[0][0])
+        deadline = time.monotonic() + self.window_s
+        while size < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    def _loop(self):
+        while True:
+            batch = self._collect()
+            texts = [text for item_texts, _ in batch for text in item_texts]
+            try:
+                outputs = self.pipe(texts, batch_size=self.max_batch, top_k=None, truncation=True) if texts else []
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            offset = 0
+            for item_texts, future in batch:
+                future.set_result(outputs[offset:offset + len(item_texts)])
+                offset += len(item_texts)
+
+            self.stats["requests"] += len(batch)
+            self.stats["texts"] += len(texts)
+            self.stats["batches"] += 1
+
+
+def make_handler(batcher):
+    class InferenceHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send_json(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/health":
+                self._send_json(200, {"status": "ok", **batcher.stats})
+            else:
+                self._send_json(404, {"error": "not found"})
+
+        def do_POST(self):
+            if self.path != "/predict":
+                self._send_json(404, {"error": "not found"})
+                return
+            try:
+                payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)))
+                results = batcher.submit(payload.get("texts") or [])
+                self._send_json(200, {"results": results})
+            except Exception as e:
+                self._send_json(500, {"error": str(e)})
+
+        def log_message(self, *args):
+            pass
+
+    return InferenceHandler
+
+
+def serve(pipe, host="127.0.0.1", port=8765, window_ms=10.0, max_batch=32):
+    batcher = DynamicBatcher(pipe, window_ms=window_ms, max_batch=max_batch)
+    server = ThreadingHTTPServer((host, port), make_handler(batcher))
+    server.daemon_threads = True
+    print(f"[INFO] Inference service jalan di http://{host}:{server.server_address[1]} "
+          f"(window {window_ms} ms, max batch {max_batch})")
+    return server
+
+
+class RemotePipeline:
+    """Client dengan antarmuka seperti pipeline HF; fallback ke pipeline lokal jika service gagal."""
+
+    def __init__(self, url, fallback=None, model_name=None):
+        self.url = url.rstrip("/")
+        self.fallback = fallback
+        self.model_name = model_name
+        self._client = httpx.Client(timeout=REQUEST_TIMEOUT)
+        self._tokenizer = None
+        self._tokenizer_failed = False
+
+    @property
+    def tokenizer(self):
+        # Hanya tokenizer yang dimuat di proses ini (untuk memecah teks panjang).
+        # Gagal dimuat (offline, belum di-cache) -> None: teks dipecah per kata,
+        # service sendiri tetap memotong input di batas model (truncation=True).
+        if self._tokenizer is None and self.model_name and not self._tokenizer_failed:
+            try:
+                from transformers import AutoTokenizer
+                self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            except Exception as e:
+                self._tokenizer_failed = True
+                print(f"[WARNING] Tokenizer {self.model_name} tidak bisa dimuat ({e}), pakai jendela kata.")
+        return self._tokenizer
+
+    def __call__(self, inputs, top_k=1, **kwargs):
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        try:
+            resp = self._client.post(f"{self.url}/predict", json={"texts": texts})
+            resp.raise_for_status()
+            outputs = resp.json()["results"]
+        except Exception as e:
+            if self.fallback is None:
+                raise
+            print(f"[WARNING] Inference service tidak bisa dipakai ({e}), pakai model lokal.")
+            return self.fallback()(inputs, top_k=top_k, **kwargs)
+
+        if top_k is None:
+            return outputs
+        return [sorted(output, key=lambda o: o["score"], reverse=True)[0] for output in outputs]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--window-ms", type=float, default=10.0)
+    parser.add_argument("--max-batch", type=int, default=32)
+    args = parser.parse_args()
+
+    from sentiment import load_local_pipeline
+    server = serve(load_local_pipeline(), args.host, args.port, args.window_ms, args.max_batch)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# labeling_policy.py
+from collections import Counter
+from dataclasses import dataclass, field
+
+from preprocessing import preprocess_batch
+
+
+@dataclass
+class LabelingPolicy:
+    """Aturan untuk menentukan label tanpa model sebelum inference dijalankan."""
+    use_rating_rules: bool = True
+    negative_max_rating: int = 2   # rating <= ini -> negative
+    positive_min_rating: int = 4   # rating >= ini -> positive
+    use_label_cache: bool = True
+    cache_size: int = 50_000
+    label_cache: dict = field(default_factory=dict)  # teks bersih -> (label, score)
+
+    def rating_label(self, rating):
+        if not self.use_rating_rules or rating is None:
+            return None
+        if rating <= self.negative_max_rating:
+            return "negative", 1.0
+        if rating >= self.positive_min_rating:
+            return "positive", 1.0
+        return None
+
+    def cached_label(self, clean_text):
+        if not self.use_label_cache:
+            return None
+        return self.label_cache.get(clean_text)
+
+    def remember(self, clean_text, label, score):
+        if not self.use_label_cache:
+            return
+        if len(self.label_cache) >= self.cache_size:
+            self.label_cache.pop(next(iter(self.label_cache)))
+        self.label_cache[clean_text] = (label, score)
+
+
+# Policy default per proses (cache label ikut bertahan antar crawl)
+DEFAULT_POLICY = LabelingPolicy()
+
+
+def plan_labels(reviews, policy=None):
+    """Pisahkan review yang labelnya sudah pasti dari yang perlu model.
+
+    Return (decided, pending, reasons):
+      decided = [(review, label, score)], pending = [(review, clean_text)],
+      reasons = Counter alasan keputusan (rating/empty/cache/model).
+    """
+    policy = policy or DEFAULT_POLICY
+    decided, to_clean, reasons = [], [], Counter()
+
+    for review in reviews:
+        by_rating = policy.rating_label(review.get("rating"))
+        if by_rating:
+            decided.append((review, *by_rating))
+            reasons["rating"] += 1
+        elif not review.get("comment_text"):
+            decided.append((review, "neutral", 0.0))
+            reasons["empty"] += 1
+        else:
+            to_clean.append(review)
+
+    pending = []
+    clean_texts = preprocess_batch([r["comment_text"] for r in to_clean])
+    for review, clean_text in zip(to_clean, clean_texts):
+        cached = policy.cached_label(clean_text) if clean_text else None
+        if not clean_text:
+            decided.append((review, "neutral", 0.0))
+            reasons["empty"] += 1
+        elif cached:
+            decided.append((review, *cached))
+            reasons["cache"] += 1
+        else:
+            pending.append((review, clean_text))
+            reasons["model"] += 1
+
+    return decided, pending, reasons
@@ -0,0 +1,105 @@
+# preprocessing.py
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import nltk
+from nltk.corpus import stopwords
+from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+
+# Worker default preprocess_batch; 0 = dikerjakan di proses ini
+PREPROCESS_PROCESSES = int(os.environ.get("PREPROCESS_PROCESSES", 0))
+
+# Stopwords & stemmer dimuat saat pertama dipakai (load_resources), bukan saat import,
+# supaya import modul ini (termasuk di worker pool) tidak mengakses jaringan
+stop_words = None
+stemmer = None
+_resources_lock = threading.Lock()
+
+def load_resources():
+    """Muat stopwords dan stemmer Bahasa Indonesia, sekali per proses."""
+    global stop_words, stemmer
+    if stemmer is not None:
+        return
+    with _resources_lock:
+        if stemmer is not None:
+            return
+        try:
+            words = stopwords.words('indonesian')
+        except LookupError:
+            # Download stopwords bahasa Indonesia (hanya jika belum ada)
+            nltk.download('stopwords', quiet=True)
+            words = stopwords.words('indonesian')
+        stop_words = set(words)
+        stemmer = StemmerFactory().create_stemmer()
+
+def preprocess_text(text):
+    if not text:
+        return ""
+    load_resources()
+    text = re.sub(r"http\S+|www\S+|https\S+", '', text)  # Hapus URL
+    text = re.sub(r'[!?.]{2,}', '.', text)               # Ganti tanda baca berulang jadi satu
+    text = re.sub(r'[^a-zA-Z0-9\s]', '', text)           # Hapus karakter non-alphanumeric
+    text = text.lower().strip()
+    # Optionally: lakukan stemming di sini
+    tokens = text.split()
+    tokens_stemmed = [stemmer.stem(token) for token in tokens if token not in stop_words]
+    return " ".join(tokens_stemmed)
+
+
+def reset_stemmer():
+    """Buat ulang stemmer (cache stem kosong lagi), mis. sebelum mengukur waktu."""
+    global stemmer
+    load_resources()
+    stemmer = StemmerFactory().create_stemmer()
+
+def _init_worker():
+    # Tiap worker memuat stopwords & stemmer (dengan cache stem-nya sendiri) sekali saja
+    load_resources()
+
+def _pool_context():
+    # Jangan fork proses yang multithread (dan mungkin sudah memuat torch). Server
+    # forkserver hanya preload modul ini, bukan script __main__ (default-nya)
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["preprocessing"])
+        return context
+    return multiprocessing.get_context("spawn")
+
+def _preprocess_chunk(texts):
+    return [preprocess_text(text) for text in texts]
+
+def length_buckets(texts, batch_size):
+    """Kelompokkan index teks per batch berdasarkan panjang, dari yang terpanjang."""
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i] or ""), reverse=True)
+    return [order[i:i + batch_size] for i in range(0, len(order), batch_size)]
+
+def preprocess_batch(texts, processes=None, chunk_size=256):
+    """Preprocess banyak teks sekaligus, opsional memakai process pool.
+
+    processes=None memakai PREPROCESS_PROCESSES (default 0: di proses ini, juga
+    untuk batch kecil); processes=1 tetap satu worker. Teks dibagi per chunk
+    berdasarkan panjang (terpanjang dikirim duluan supaya beban worker rata).
+    Hasil dikembalikan sesuai urutan input.
+
+    Pool hanya untuk entry point biasa (CLI, benchmark) yang dijaga
+    `if __name__ == "__main__"`: worker forkserver/spawn meng-import ulang
+    script __main__, dan di Streamlit itu berarti app.py ikut dijalankan.
+    """
+    texts = list(texts)
+    if processes is None:
+        processes = PREPROCESS_PROCESSES
+    if processes == 0 or len(texts) <= chunk_size:
+        return _preprocess_chunk(texts)
+
+    chunks = length_buckets(texts, chunk_size)
+    results = [None] * len(texts)
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                             mp_context=_pool_context()) as pool:
+        outputs = pool.map(_preprocess_chunk, [[texts[i] for i in chunk] for chunk in chunks])
+        for chunk, output in zip(chunks, outputs):
+            for i, clean_text in zip(chunk, output):
+                results[i] = clean_text
+    return results
@@ -0,0 +1,77 @@
+# relative_dates.py
+import re
+from datetime import datetime
+from functools import lru_cache
+
+import dateparser
+from dateutil.relativedelta import relativedelta
+
+# Frasa tanggal relatif dari SerpApi, mis. "2 minggu lalu", "sebulan yang lalu",
+# "Diedit 3 bulan lalu", "a week ago".
+UNITS = {
+    "detik": "seconds", "second": "seconds",
+    "menit": "minutes", "minute": "minutes",
+    "jam": "hours", "hour": "hours",
+    "hari": "days", "day": "days",
+    "minggu": "weeks", "week": "weeks",
+    "bulan": "months", "month": "months",
+    "tahun": "years", "year": "years",
+}
+NUMBER_WORDS = {
+    "se": 1, "satu": 1, "a": 1, "an": 1, "one": 1,
+    "dua": 2, "two": 2, "tiga": 3, "three": 3, "empat": 4, "four": 4,
+    "lima": 5, "five": 5, "enam": 6, "six": 6, "tujuh": 7, "seven": 7,
+    "delapan": 8, "eight": 8, "sembilan": 9, "nine": 9, "sepuluh": 10, "ten": 10,
+    "sebelas": 11, "eleven": 11,
+}
+FIXED_OFFSETS = {
+    "baru saja": relativedelta(), "just now": relativedelta(),
+    "hari ini": relativedelta(), "today": relativedelta(),
+    "kemarin": relativedelta(days=1), "yesterday": relativedelta(days=1),
+}
+
+RELATIVE_PATTERN = re.compile(
+    r"^(?P<num>\d+|[a-z]+?)\s*(?P<unit>" + "|".join(UNITS) + r")s?\s+(?:yang\s+)?(?:lalu|ago)$"
+)
+EDITED_PREFIX = re.compile(r"^(?:diedit|edited)\s+")
+
+
+def normalize_phrase(phrase):
+    phrase = re.sub(r"\s+", " ", str(phrase).strip().lower())
+    return EDITED_PREFIX.sub("", phrase)
+
+
+def parse_offset(phrase):
+    """Ubah frasa relatif jadi relativedelta; None jika pola tidak dikenal."""
+    if phrase in FIXED_OFFSETS:
+        return FIXED_OFFSETS[phrase]
+
+    match = RELATIVE_PATTERN.match(phrase)
+    if not match:
+        return None
+    num = match.group("num")
+    amount = int(num) if num.isdigit() else NUMBER_WORDS.get(num)
+    if amount is None:
+        return None
+    return relativedelta(**{UNITS[match.group("unit")]: amount})
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(phrase, anchor):
+    offset = parse_offset(phrase)
+    if offset is not None:
+        return anchor - offset
+    # Fallback untuk format lain (tanggal absolut, bahasa lain, dst.)
+    return dateparser.parse(phrase, settings={"RELATIVE_BASE": anchor})
+
+
+def parse_relative_date(phrase, anchor=None):
+    """Tanggal perkiraan untuk frasa relatif, dihitung mundur dari anchor (waktu crawl).
+
+    Hasil di-memo per (frasa, anchor), jadi satu crawl dengan banyak
+    "sebulan lalu" hanya menghitung sekali.
+    """
+    if not phrase:
+        return None
+    anchor = anchor or datetime.now().replace(microsecond=0)
+    return _parse_cached(normalize_phrase(phrase), anchor)
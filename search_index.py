@@ -0,0 +1,340 @@
+# search_index.py
+"""Index full-text lokal (SQLite FTS5) untuk pencarian komentar.
+
+Token yang diindeks adalah hasil preprocess_text, jadi query "antrian" juga
+menemukan "antri", dst. Tabel docs menyimpan kolom filter/urutan (source,
+rating, skor, tanggal) supaya satu halaman hasil bisa dihitung di SQLite.
+
+Backfill awal untuk tabel besar sebaiknya dijalankan offline:
+    python search_index.py build
+"""
+import argparse
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+
+from comments_frame import parse_timestamps
+from preprocessing import preprocess_batch, preprocess_text
+
+DEFAULT_INDEX_PATH = os.environ.get("SEARCH_INDEX_PATH", "comments_index.db")
+INDEX_BATCH_SIZE = int(os.environ.get("SEARCH_INDEX_BATCH_SIZE", 5000))
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    rowid INTEGER PRIMARY KEY,
+    review_id TEXT UNIQUE NOT NULL,
+    source TEXT,
+    rating INTEGER,
+    sentiment_score REAL,
+    created_at TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS comments_fts USING fts5(tokens, tokenize='unicode61');
+"""
+SORT_COLUMNS = {"created_at", "rating", "sentiment_score", "source"}
+# Satu index per kolom & arah dengan urutan persis seperti search_page (NULL di akhir,
+# review_id naik), supaya halaman bisa diambil dengan menelusuri index lalu berhenti
+# di LIMIT. source ikut disimpan agar filter source tidak perlu membaca tabel docs.
+SORT_INDEXES = "".join(
+    f"CREATE INDEX IF NOT EXISTS docs_{col}_{direction.lower()} "
+    f"ON docs({col} IS NULL, {col} {direction}, review_id{'' if col == 'source' else ', source'});\n"
+    for col in sorted(SORT_COLUMNS) for direction in ("ASC", "DESC")
+)
+# Perkiraan biaya satu cek keanggotaan FTS per term, relatif terhadap join+sort satu
+# baris hasil (diukur di index 1 juta review, lihat benchmarks/bench_search_index.py)
+WALK_PROBE_COST = 32
+DOC_COLUMNS = ["review_id", "source", "rating", "sentiment_score", "created_at"]
+
+
+def connect_index(path=None):
+    conn = sqlite3.connect(path or DEFAULT_INDEX_PATH)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+        # Index lama belum punya kolom filter/urutan: buang, akan dibangun ulang oleh backfill
+        conn.executescript("DROP TABLE IF EXISTS docs; DROP TABLE IF EXISTS comments_fts;")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.executescript(SCHEMA + SORT_INDEXES)
+    return conn
+
+
+def _doc_rows(reviews):
+    """Kolom docs untuk tiap review, dinormalisasi sekali per batch."""
+    frame = pd.DataFrame.from_records(reviews, columns=DOC_COLUMNS)
+    created_at = parse_timestamps(frame["created_at"]).dt.strftime("%Y-%m-%dT%H:%M:%S")
+    rating = pd.to_numeric(frame["rating"], errors="coerce").round()
+    score = pd.to_numeric(frame["sentiment_score"], errors="coerce")
+    source = frame["source"].astype(object)
+    return [
+        (
+            review_id,
+            None if pd.isna(src) else str(src),
+            None if pd.isna(r) else int(r),
+            None if pd.isna(s) else float(s),
+            None if pd.isna(c) else c,
+        )
+        for review_id, src, r, s, c in zip(frame["review_id"], source, rating, score, created_at)
+    ]
+
+
+def index_reviews(reviews, path=None, processes=None):
+    """Tambah/perbarui review (dict dengan review_id, comment_text & kolom docs) di index."""
+    reviews = [r for r in reviews if r.get("review_id")]
+    if not reviews:
+        return 0
+
+    tokens = preprocess_batch([r.get("comment_text") or "" for r in reviews], processes=processes)
+    conn = connect_index(path)
+    try:
+        with conn:
+            for (review_id, *meta), review_tokens in zip(_doc_rows(reviews), tokens):
+                row = conn.execute("SELECT rowid FROM docs WHERE review_id = ?", (review_id,)).fetchone()
+                if row:
+                    rowid = row[0]
+                    conn.execute(
+                        "UPDATE docs SET source = ?, rating = ?, sentiment_score = ?, created_at = ? WHERE rowid = ?",
+                        (*meta, rowid),
+                    )
+                    conn.execute("DELETE FROM comments_fts WHERE rowid = ?", (rowid,))
+                else:
+                    rowid = conn.execute(
+                        "INSERT INTO docs (review_id, source, rating, sentiment_score, created_at) VALUES (?, ?, ?, ?, ?)",
+                        (review_id, *meta),
+                    ).lastrowid
+
+                conn.execute("INSERT INTO comments_fts (rowid, tokens) VALUES (?, ?)", (rowid, review_tokens))
+    finally:
+        conn.close()
+    return len(reviews)
+
+
+def update_sentiment_scores(scores, path=None):
+    """Perbarui skor sentimen (review_id, skor) di docs tanpa mengindeks ulang teks."""
+    conn = connect_index(path)
+    try:
+        with conn:
+            conn.executemany("UPDATE docs SET sentiment_score = ? WHERE review_id = ?",
+                             [(score, review_id) for review_id, score in scores])
+    finally:
+        conn.close()
+
+
+def delete_reviews(review_ids, path=None):
+    conn = connect_index(path)
+    try:
+        with conn:
+            for review_id in review_ids:
+                row = conn.execute("SELECT rowid FROM docs WHERE review_id = ?", (review_id,)).fetchone()
+                if row:
+                    conn.execute("DELETE FROM comments_fts WHERE rowid = ?", (row[0],))
+                    conn.execute("DELETE FROM docs WHERE rowid = ?", (row[0],))
+    finally:
+        conn.close()
+
+
+def build_match_query(query, match_any=False):
+    tokens = preprocess_text(query).split()
+    if not tokens:
+        return None
+    joiner = " OR " if match_any else " "
+    return joiner.join(f'"{token}"' for token in tokens)
+
+
+def search_reviews(query, limit=1000, match_any=False, ranked=False, path=None):
+    """Cari review_id yang cocok dengan query.
+
+    Default urut dari yang terakhir diindex (cepat, bisa berhenti di LIMIT);
+    ranked=True mengurutkan menurut bm25 tapi harus menilai semua hasil.
+    """
+    match = build_match_query(query, match_any=match_any)
+    if not match:
+        return []
+
+    order = "rank" if ranked else "comments_fts.rowid DESC"
+    conn = connect_index(path)
+    try:
+        rows = conn.execute(
+            "SELECT d.review_id FROM comments_fts "
+            "JOIN docs d ON d.rowid = comments_fts.rowid "
+            f"WHERE comments_fts MATCH ? ORDER BY {order} LIMIT ?",
+            (match, limit),
+        ).fetchall()
+    finally:
+        conn.close()
+    return [r[0] for r in rows]
+
+
+def _count_matches(conn, match, source=None):
+    if not source:
+        # Tanpa filter source, COUNT cukup dari FTS saja (tanpa join ke docs)
+        return conn.execute("SELECT COUNT(*) FROM comments_fts WHERE comments_fts MATCH ?", (match,)).fetchone()[0]
+    return conn.execute(
+        "SELECT COUNT(*) FROM comments_fts JOIN docs d ON d.rowid = comments_fts.rowid "
+        "WHERE comments_fts MATCH ? AND d.source = ?",
+        (match, source),
+    ).fetchone()[0]
+
+
+def count_search_results(query, source=None, match_any=False, path=None):
+    """Total hasil pencarian; cukup dihitung sekali per query + filter, bukan per halaman."""
+    match = build_match_query(query, match_any=match_any)
+    if not match:
+        return 0
+    conn = connect_index(path)
+    try:
+        return _count_matches(conn, match, source)
+    finally:
+        conn.close()
+
+
+def search_page(query, page=1, page_size=50, sort_by="created_at", descending=True,
+                source=None, match_any=False, path=None, total=None):
+    """Satu halaman hasil pencarian (review_id terurut) + total hasil, dihitung di SQLite.
+
+    Urutan sama dengan fetch_comments_page: NULL di akhir, review_id sebagai tiebreaker.
+    total dari count_search_results boleh diberikan agar COUNT tidak diulang tiap halaman.
+
+    Jika hasil padat, index urutan docs ditelusuri dan tiap baris dicek keanggotaannya
+    di FTS, berhenti begitu halaman penuh. Jika hasil jarang (atau halaman sangat
+    dalam), semua hasil FTS di-join ke docs lalu diurutkan.
+    """
+    if sort_by not in SORT_COLUMNS:
+        raise ValueError(f"Kolom urutan tidak dikenal: {sort_by}")
+    match = build_match_query(query, match_any=match_any)
+    if not match:
+        return [], 0
+
+    direction = "DESC" if descending else "ASC"
+    order = f"ORDER BY d.{sort_by} IS NULL, d.{sort_by} {direction}, d.review_id LIMIT ? OFFSET ?"
+    offset = (page - 1) * page_size
+
+    conn = connect_index(path)
+    try:
+        if total is None:
+            total = _count_matches(conn, match, source)
+        if offset >= total:
+            return [], total
+
+        # Perkiraan baris docs yang ditelusuri sampai halaman ini penuh vs jumlah hasil
+        docs = conn.execute("SELECT MAX(rowid) FROM docs").fetchone()[0] or 0
+        scanned = (offset + page_size) * docs / total
+        terms = match.count('"') // 2
+        source_filter = "d.source = ? AND " if source else ""
+        params = ([source] if source else []) + [match]
+        if scanned * terms * WALK_PROBE_COST <= total:
+            sql = (f"SELECT d.review_id FROM docs d WHERE {source_filter}"
+                   f"EXISTS (SELECT 1 FROM comments_fts f WHERE f.rowid = d.rowid AND f.comments_fts MATCH ?) {order}")
+        else:
+            sql = ("SELECT d.review_id FROM comments_fts JOIN docs d ON d.rowid = comments_fts.rowid "
+                   f"WHERE {source_filter}comments_fts MATCH ? {order}")
+        rows = conn.execute(sql, (*params, page_size, offset)).fetchall()
+    finally:
+        conn.close()
+    return [r[0] for r in rows], total
+
+
+def indexed_review_ids(path=None):
+    conn = connect_index(path)
+    try:
+        return {r[0] for r in conn.execute("SELECT review_id FROM docs")}
+    finally:
+        conn.close()
+
+
+def sync_search_index(records, path=None, batch_size=INDEX_BATCH_SIZE, processes=None):
+    """Index hanya review yang belum ada di index (backfill / catch-up), per batch.
+
+    Tiap batch di-commit sendiri, jadi backfill yang terputus bisa dilanjutkan.
+    """
+    known = indexed_review_ids(path)
+    missing = [r for r in records if r.get("review_id") and r["review_id"] not in known]
+    if missing:
+        print(f"[INFO] Menambahkan {len(missing)} review ke search index.")
+    for i in range(0, len(missing), batch_size):
+        index_reviews(missing[i:i + batch_size], path=path, processes=processes)
+    if len(missing) >= batch_size:
+        optimize_index(path)
+    return len(missing)
+
+
+def optimize_index(path=None):
+    """Gabungkan segmen FTS setelah backfill besar.
+
+    Tiap batch meninggalkan segmen sendiri; cek keanggotaan per baris di search_page
+    harus membuka semua segmen, jadi jauh lebih lambat sebelum digabung.
+    """
+    conn = connect_index(path)
+    try:
+        with conn:
+            conn.execute("INSERT INTO comments_fts(comments_fts) VALUES('optimize')")
+    finally:
+        conn.close()
+
+
+class IndexBackfill:
+    """Jalankan sync_search_index di thread latar (satu run sekaligus).
+
+    ensure() tidak pernah memblok request: selama backfill pertama belum
+    selesai, pemanggil memakai pencarian teks biasa.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.synced_key = None
+        self.ready = False
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def ensure(self, key, records_fn):
+        """True jika index bisa dipakai; mulai catch-up untuk key jika belum tersinkron."""
+        with self._lock:
+            running = self._thread is not None and self._thread.is_alive()
+            if self.synced_key != key and not running:
+                self._thread = threading.Thread(target=self._run, args=(key, records_fn), daemon=True)
+                self._thread.start()
+            return self.ready
+
+    def _run(self, key, records_fn):
+        try:
+            sync_search_index(records_fn(), path=self.path)
+            self.synced_key = key
+            self.ready = True
+        except Exception as e:
+            print(f"[WARNING] Backfill search index gagal: {e}")
+
+
+def fetch_index_records(client, page_size=1000):
+    """Semua review dari Supabase (hanya kolom yang dibutuhkan index), per halaman."""
+    offset = 0
+    while True:
+        resp = (
+            client.table("comments").select("comment_text," + ",".join(DOC_COLUMNS))
+            .order("review_id")
+            .range(offset, offset + page_size - 1)
+            .execute()
+        )
+        rows = resp.data or []
+        yield from rows
+        if len(rows) < page_size:
+            break
+        offset += page_size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("--path", default=DEFAULT_INDEX_PATH)
+    parser.add_argument("--batch-size", type=int, default=INDEX_BATCH_SIZE)
+    parser.add_argument("--processes", type=int, default=os.cpu_count(), help="worker preprocess (0 = tanpa pool)")
+    args = parser.parse_args()
+
+    from supabase_utils import get_supabase_client
+    added = sync_search_index(list(fetch_index_records(get_supabase_client())), path=args.path,
+                              batch_size=args.batch_size, processes=args.processes)
+    print(f"[INFO] Search index {args.path}: {added} review baru diindeks.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,44 @@
 # sentiment.py
-import re
+import os
 from datetime import datetime
 from supabase_utils import get_supabase_client
+from preprocessing import preprocess_text, length_buckets
+from labeling_policy import DEFAULT_POLICY, plan_labels
+from search_index import index_reviews, update_sentiment_scores
+from inference_service import RemotePipeline
 
-import nltk
-from nltk.corpus import stopwords
-from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
 from transformers import pipeline
 
-# Setup Supabase client
-supabase = get_supabase_client()
-
-# Download stopwords bahasa Indonesia (jika belum)
-nltk.download('stopwords', quiet=True)
-stop_words = set(stopwords.words('indonesian'))
-
-# Setup stemmer Bahasa Indonesia
-stemmer_factory = StemmerFactory()
-stemmer = stemmer_factory.create_stemmer()
-
-# Setup sentiment analysis pipeline dengan model IndoBERT
-sentiment_pipeline = pipeline("sentiment-analysis", model="mdhugol/indonesia-bert-sentiment-classification")
-
-def preprocess_text(text):
-    if not text:
-        return ""
-    text = re.sub(r"http\S+|www\S+|https\S+", '', text)  # Hapus URL
-    text = re.sub(r'[!?.]{2,}', '.', text)               # Ganti tanda baca berulang jadi satu
-    text = re.sub(r'[^a-zA-Z0-9\s]', '', text)           # Hapus karakter non-alphanumeric
-    text = text.lower().strip()
-    # Optionally: lakukan stemming di sini
-    tokens = text.split()
-    tokens_stemmed = [stemmer.stem(token) for token in tokens if token not in stop_words]
-    return " ".join(tokens_stemmed)
+MODEL_NAME = "mdhugol/indonesia-bert-sentiment-classification"
+MAX_TOKENS = 512     # panjang maksimum input IndoBERT (termasuk token spesial)
+WINDOW_STRIDE = 128  # overlap antar jendela untuk teks yang lebih panjang
+
+# Aktifkan jika tabel comments punya kolom created_at_text & crawled_at
+STORE_DATE_ANCHOR = os.environ.get("STORE_DATE_ANCHOR", "0") == "1"
+
+# Jika diisi (mis. http://127.0.0.1:8765), inference dikirim ke inference_service.py
+INFERENCE_SERVICE_URL = os.environ.get("INFERENCE_SERVICE_URL")
+
+# Pipeline dibuat saat pertama dipakai (bukan saat import), supaya modul ini
+# bisa diimport tanpa model, mis. untuk benchmark.
+sentiment_pipeline = None
+local_pipeline = None
+
+def load_local_pipeline():
+    global local_pipeline
+    if local_pipeline is None:
+        # Setup sentiment analysis pipeline dengan model IndoBERT
+        local_pipeline = pipeline("sentiment-analysis", model=MODEL_NAME)
+    return local_pipeline
+
+def get_sentiment_pipeline():
+    global sentiment_pipeline
+    if sentiment_pipeline is None:
+        if INFERENCE_SERVICE_URL:
+            sentiment_pipeline = RemotePipeline(INFERENCE_SERVICE_URL, fallback=load_local_pipeline, model_name=MODEL_NAME)
+        else:
+            sentiment_pipeline = load_local_pipeline()
+    return sentiment_pipeline
 
 def analyze_sentiment(text):
     if not text:
@@ -41,21 +47,74 @@ def analyze_sentiment(text):
     if not clean_text:
         return "neutral", 0.0
     print(f"[DEBUG] Text ke pipeline: {clean_text[:512]}")
-    result = sentiment_pipeline(clean_text[:512])
-    label = result[0]['label'].lower()
-    score = float(result[0]['score'])
+    label, score = analyze_sentiment_batch([clean_text])[0]
     print(f"[DEBUG] Label: {label}, Score: {score}")
     return label, score
 
-def analyze_sentiment_with_rating(text, rating=None):
-    label, score = analyze_sentiment(text)
-    if rating is not None:
-        # Overwrite label dan score berdasarkan rating untuk akurasi label manual
-        if rating <= 2:
-            label, score = "negative", 1.0
-        elif rating >= 4:
-            label, score = "positive", 1.0
-    return label, score
+def split_token_windows(text, tokenizer=None, max_tokens=MAX_TOKENS, stride=WINDOW_STRIDE):
+    """Pecah teks jadi jendela token yang saling overlap jika melebihi batas model.
+
+    Teks yang muat dikembalikan utuh. Tanpa tokenizer, kata (split spasi)
+    dianggap sebagai token.
+    """
+    if tokenizer is None:
+        ids, budget = text.split(), max_tokens
+        decode = " ".join
+    else:
+        ids = tokenizer(text, add_special_tokens=False)["input_ids"]
+        budget = max_tokens - tokenizer.num_special_tokens_to_add()
+        decode = tokenizer.decode
+
+    if len(ids) <= budget:
+        return [text]
+
+    windows = []
+    step = budget - stride
+    for start in range(0, len(ids), step):
+        windows.append(decode(ids[start:start + budget]))
+        if start + budget >= len(ids):
+            break
+    return windows
+
+def analyze_sentiment_batch(clean_texts, batch_size=16):
+    """Inference untuk teks yang sudah di-preprocess, per batch dengan panjang mirip.
+
+    Teks panjang dipecah jadi beberapa jendela token yang ikut di batch yang sama;
+    skor per label dirata-rata (bobot panjang jendela). Hasil [(label, score)]
+    urut sesuai input.
+    """
+    pipe = get_sentiment_pipeline()
+    tokenizer = getattr(pipe, "tokenizer", None)
+
+    windows, owners = [], []
+    for i, clean_text in enumerate(clean_texts):
+        for window in split_token_windows(clean_text, tokenizer):
+            windows.append(window)
+            owners.append(i)
+
+    label_scores = [{} for _ in clean_texts]
+    weights = [0] * len(clean_texts)
+    for bucket in length_buckets(windows, batch_size):
+        outputs = pipe([windows[j] for j in bucket], batch_size=batch_size, top_k=None, truncation=True)
+        for j, output in zip(bucket, outputs):
+            owner, weight = owners[j], max(len(windows[j]), 1)
+            weights[owner] += weight
+            for item in output:
+                label = item['label'].lower()
+                label_scores[owner][label] = label_scores[owner].get(label, 0.0) + float(item['score']) * weight
+
+    results = []
+    for scores, weight in zip(label_scores, weights):
+        label = max(scores, key=scores.get)
+        results.append((label, scores[label] / weight))
+    return results
+
+def analyze_sentiment_with_rating(text, rating=None, policy=None):
+    # Label dari rating untuk akurasi label manual; model hanya jika rating tidak menentukan
+    by_rating = (policy or DEFAULT_POLICY).rating_label(rating)
+    if by_rating:
+        return by_rating
+    return analyze_sentiment(text)
 
 def map_sentiment_label(label):
     mapping = {
@@ -68,26 +127,56 @@ def map_sentiment_label(label):
     }
     return mapping.get(label, "netral")
 
-def update_sentiment_in_supabase():
+def update_sentiment_in_supabase(policy=None, batch_size=16):
+    supabase = get_supabase_client()
+    policy = policy or DEFAULT_POLICY
     res = supabase.table("comments").select("*").is_("sentimen_label", None).execute()
-    for review in res.data:
-        text = review.get("comment_text", "")
-        rating = review.get("rating")
-        label, score = analyze_sentiment_with_rating(text, rating)
-        label_mapped = map_sentiment_label(label)
 
+    # Tentukan dulu review mana yang benar-benar butuh model
+    decided, pending, reasons = plan_labels(res.data, policy)
+    # Teks bersih yang sama cukup diinferensi sekali
+    unique_texts = list(dict.fromkeys(clean_text for _, clean_text in pending))
+    if unique_texts:
+        outputs = analyze_sentiment_batch(unique_texts, batch_size=batch_size)
+        for clean_text, (label, score) in zip(unique_texts, outputs):
+            policy.remember(clean_text, label, score)
+        labels = dict(zip(unique_texts, outputs))
+        decided.extend((review, *labels[clean_text]) for review, clean_text in pending)
+
+    for review, label, score in decided:
         supabase.table("comments").update({
-            "sentimen_label": label_mapped,
+            "sentimen_label": map_sentiment_label(label),
             "sentiment_score": score,
             "processed_at": datetime.now().isoformat()
         }).eq("review_id", review["review_id"]).execute()
 
+    # Skor dipakai untuk urutan hasil pencarian di search index
+    try:
+        update_sentiment_scores([(review["review_id"], score) for review, _, score in decided])
+    except Exception as e:
+        print(f"[WARNING] Gagal update search index: {e}")
+
+    total = len(decided)
+    stats = {
+        "total": total,
+        "inferred": len(unique_texts),
+        "skipped": total - len(unique_texts),
+        "reasons": dict(reasons),
+    }
+    if total:
+        print(f"[INFO] {total} review diberi label, {stats['inferred']} inference ke model, "
+              f"{stats['skipped']} dihemat ({stats['skipped'] / total:.0%}). Alasan: {stats['reasons']}")
+    else:
+        print("[INFO] Tidak ada review baru untuk dianalisis.")
+    return stats
+
 def save_reviews_to_supabase(reviews, source):
-    supabase = get_supabase_client()  # pastikan client aktif
+    supabase = get_supabase_client()  # client bersama (koneksi dipakai ulang)
     print(f"[INFO] Mulai menyimpan {len(reviews)} review dari sumber {source} ke Supabase.")
 
     success_count = 0
     total = len(reviews)
+    saved_reviews = []
 
     for review in reviews:
         review_id = review.get("review_id")
@@ -113,6 +202,12 @@ def save_reviews_to_supabase(reviews, source):
             "processed_at": None          # default
         }
 
+        # Simpan frasa tanggal asli + anchor waktu crawl supaya created_at bisa dihitung ulang
+        if STORE_DATE_ANCHOR and review.get("crawled_at"):
+            crawled_at_val = review["crawled_at"]
+            data["created_at_text"] = review.get("created_at_text")
+            data["crawled_at"] = crawled_at_val.isoformat() if isinstance(crawled_at_val, datetime) else crawled_at_val
+
         try:
             response = supabase.table("comments").upsert(data, on_conflict="review_id").execute()
 
@@ -120,6 +215,7 @@ def save_reviews_to_supabase(reviews, source):
             if response.data:
                 print(f"[SUCCESS] Review ID {review_id} berhasil disimpan/upsert.")
                 success_count += 1
+                saved_reviews.append(data)
             else:
                 print(f"[ERROR] Gagal simpan review ID {review_id}, response kosong: {response}")
 
@@ -127,4 +223,11 @@ def save_reviews_to_supabase(reviews, source):
             print(f"[EXCEPTION] Saat simpan review ID {review_id}: {e}")
 
     print(f"[INFO] Total {success_count} dari {total} review berhasil disimpan ke Supabase.")
+
+    # Update search index secara incremental untuk review yang tersimpan
+    try:
+        index_reviews(saved_reviews)
+    except Exception as e:
+        print(f"[WARNING] Gagal update search index: {e}")
+
     return success_count == total
\ No newline at end of file
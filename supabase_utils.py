@@ -1,7 +1,22 @@
-from supabase import create_client, Client
+import os
+import threading
 
-def get_supabase_client(url=None, key=None) -> Client:
-    import os
+import httpx
+from supabase import Client
+
+# Pengaturan pool koneksi HTTP bersama (bisa diubah lewat environment)
+POOL_MAX_CONNECTIONS = int(os.environ.get("SUPABASE_POOL_MAX_CONNECTIONS", 20))
+POOL_MAX_KEEPALIVE = int(os.environ.get("SUPABASE_POOL_MAX_KEEPALIVE", 10))
+POOL_KEEPALIVE_EXPIRY = float(os.environ.get("SUPABASE_POOL_KEEPALIVE_EXPIRY", 60))
+REQUEST_TIMEOUT = float(os.environ.get("SUPABASE_REQUEST_TIMEOUT", 30))
+CONNECT_TIMEOUT = float(os.environ.get("SUPABASE_CONNECT_TIMEOUT", 5))
+USE_HTTP2 = os.environ.get("SUPABASE_HTTP2", "1") != "0"
+
+# Registry client per proses, key = (url, key)
+_clients = {}
+_clients_lock = threading.Lock()
+
+def _resolve_credentials(url=None, key=None):
     try:
         import streamlit as st
         url = url or os.environ.get("SUPABASE_URL") or st.secrets["SUPABASE_URL"]
@@ -12,5 +27,86 @@ def get_supabase_client(url=None, key=None) -> Client:
 
     if not url or not key:
         raise RuntimeError("Missing SUPABASE_URL or SUPABASE_KEY")
+    return url, key
+
+def create_http_client() -> httpx.Client:
+    """httpx client dengan pool keep-alive (HTTP/2 jika paket h2 tersedia)."""
+    http2 = USE_HTTP2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            http2 = False
+
+    return httpx.Client(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=POOL_MAX_KEEPALIVE,
+            keepalive_expiry=POOL_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+        follow_redirects=True,
+    )
+
+class PooledClient(Client):
+    """Client Supabase dengan httpx client ber-pool khusus untuk PostgREST.
+
+    Pool tidak dipasang lewat ClientOptions(httpx_client=...): opsi itu juga
+    dipakai storage & functions, yang mengganti base_url client bersama.
+    Auth, storage dan functions tetap memakai transport bawaan masing-masing.
+    """
+
+    def __init__(self, supabase_url, supabase_key, options=None):
+        super().__init__(supabase_url, supabase_key, options)
+        self.http_client = create_http_client()
+
+    @property
+    def postgrest(self):
+        # Dibuat ulang setelah event auth (token berubah), pool tetap sama
+        if self._postgrest is None:
+            self._postgrest = self._init_postgrest_client(
+                rest_url=self.rest_url,
+                headers=self.options.headers,
+                schema=self.options.schema,
+                http_client=self.http_client,
+            )
+        return self._postgrest
+
+def create_supabase_client(url=None, key=None) -> Client:
+    """Buat client baru (tidak lewat registry); query table lewat pool HTTP sendiri.
+
+    Timeout PostgREST hanya diatur di create_http_client: begitu http_client
+    diberikan, postgrest_client_timeout di ClientOptions tidak dipakai lagi.
+    """
+    url, key = _resolve_credentials(url, key)
+    return PooledClient.create(url, key)
+
+def register_supabase_client(client, url=None, key=None):
+    """Daftarkan client yang sudah jadi (mis. client palsu untuk benchmark)."""
+    with _clients_lock:
+        _clients[(url, key)] = client
+
+def get_supabase_client(url=None, key=None) -> Client:
+    """Client Supabase bersama untuk satu proses; koneksi HTTP dipakai ulang antar modul."""
+    with _clients_lock:
+        client = _clients.get((url, key))
+    if client is not None:
+        return client
+
+    url, key = _resolve_credentials(url, key)
+    with _clients_lock:
+        client = _clients.get((url, key))
+        if client is None:
+            client = _clients[(url, key)] = create_supabase_client(url, key)
+    return client
 
-    return create_client(url, key)
\ No newline at end of file
+def reset_supabase_clients():
+    """Kosongkan registry dan tutup koneksi HTTP client yang dibuat di sini."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        http_client = getattr(client, "http_client", None)
+        if http_client is not None:
+            http_client.close()